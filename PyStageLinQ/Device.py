@@ -1,17 +1,52 @@
+from __future__ import annotations
+import heapq
+import itertools
+from typing import Hashable
 from . import DataClasses
 from . import Network
 
 
 class DeviceList:
-    device_list: [DataClasses.StageLinQDiscoveryData]
+    device_list: [Network.StageLinQService]
 
     def __init__(self):
         self.device_list = []
+        # Indexes used to look up devices on every received discovery frame
+        self._devices_by_name_port = {}
+        self._devices_by_token = {}
+        # Number of registered devices per device name that are not OfflineAnalyzer instances
+        self._main_interfaces = {}
 
     def register_device(self, device: Network.StageLinQService) -> bool:
         if type(device) is not Network.StageLinQService:
             return False
         self.device_list.append(device)
+
+        self._devices_by_name_port[(device.device_name, device.Port)] = device
+        self._devices_by_token[device.device_token.get_token()] = device
+        if device.sw_name != "OfflineAnalyzer":
+            self._main_interfaces[device.device_name] = (
+                self._main_interfaces.get(device.device_name, 0) + 1
+            )
+        return True
+
+    def unregister_device(self, device: Network.StageLinQService) -> bool:
+        if device not in self.device_list:
+            return False
+        self.device_list.remove(device)
+
+        name_port = (device.device_name, device.Port)
+        if self._devices_by_name_port.get(name_port) is device:
+            del self._devices_by_name_port[name_port]
+
+        token = device.device_token.get_token()
+        if self._devices_by_token.get(token) is device:
+            del self._devices_by_token[token]
+
+        if device.sw_name != "OfflineAnalyzer":
+            self._main_interfaces[device.device_name] -= 1
+            if self._main_interfaces[device.device_name] == 0:
+                del self._main_interfaces[device.device_name]
         return True
 
     def find_registered_device(
@@ -23,19 +58,88 @@ class DeviceList:
                 return True
 
         # Check if device is registered
-        for device in self.device_list:
-            if discovery_frame.DeviceName == device.device_name:
-                if discovery_frame.ReqServicePort == device.Port:
-                    # Device already registered
-                    return True
-        return False
+        return (
+            discovery_frame.DeviceName,
+            discovery_frame.ReqServicePort,
+        ) in self._devices_by_name_port
 
     def find_main_interface(
         self, discovery_frame: DataClasses.StageLinQDiscoveryData
     ) -> bool:
-        for device in self.device_list:
-            if device.device_name == discovery_frame.DeviceName:
-                if device.sw_name != "OfflineAnalyzer":
-                    return True
+        return discovery_frame.DeviceName in self._main_interfaces
+
+    def get_device(
+        self, discovery_frame: DataClasses.StageLinQDiscoveryData
+    ) -> Network.StageLinQService | None:
+        return self.get_device_by_name_port(
+            discovery_frame.DeviceName, discovery_frame.ReqServicePort
+        )
+
+    def get_device_by_name_port(
+        self, device_name: str, port: int
+    ) -> Network.StageLinQService | None:
+        return self._devices_by_name_port.get((device_name, port))
+
+    def get_device_by_token(self, token: int) -> Network.StageLinQService | None:
+        return self._devices_by_token.get(token)
+
+
+class DeviceLivenessTracker:
+    """
+    Keeps track of when devices last announced themselves. Every device has one deadline in a heap, so finding lost
+    devices only touches devices whose deadline has passed instead of sweeping all devices.
+
+    :param timeout: Time in seconds a device may stay silent before it is considered lost.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._last_seen = {}
+        self._scheduled = {}
+        self._deadlines = []
+        self._counter = itertools.count()
+
+    def seen(self, key: Hashable, now: float) -> None:
+        self._last_seen[key] = now
+        if key not in self._scheduled:
+            self._schedule(key, now + self.timeout)
+
+    def forget(self, key: Hashable) -> None:
+        # Heap entry is discarded when it is popped
+        self._last_seen.pop(key, None)
+        self._scheduled.pop(key, None)
+
+    def next_deadline(self) -> float | None:
+        while self._deadlines:
+            deadline, _, key = self._deadlines[0]
+            if self._scheduled.get(key) == deadline:
+                return deadline
+            heapq.heappop(self._deadlines)
+        return None
+
+    def pop_lost(self, now: float) -> list[Hashable]:
+        lost = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, _, key = heapq.heappop(self._deadlines)
+            if self._scheduled.get(key) != deadline:
+                # Device forgotten or rescheduled
+                continue
+
+            last_seen_deadline = self._last_seen[key] + self.timeout
+            if last_seen_deadline > now:
+                # Device has been seen since it was scheduled
+                self._schedule(key, last_seen_deadline)
+            else:
+                self.forget(key)
+                lost.append(key)
+        return lost
+
+    def _schedule(self, key: Hashable, deadline: float) -> None:
+        self._scheduled[key] = deadline
+        heapq.heappush(self._deadlines, (deadline, next(self._counter), key))
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
 
-        return False
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scheduled
@@ -360,6 +360,12 @@ class StateMapSubscription:
     def get_task(self) -> asyncio.Task:
         return self.state_map_task
 
+    def stop(self) -> None:
+        if self.state_map_task is not None:
+            self.state_map_task.cancel()
+        if self.writer is not None:
+            self.writer.close()
+
     async def read_state_map(self) -> None:
         trailing_data = bytearray()
         while True:
@@ -183,18 +183,20 @@ class StageLinQServiceAnnouncement(StageLinQMessage):
         request_frame += service_announcement_data.Port.to_bytes(2, byteorder="big")
         return request_frame
 
-    def decode_frame(self, frame):
-        if len(frame) < self.min_length:
+    def decode_frame(self, frame, start_offset=0):
+        if len(frame) - start_offset < self.min_length:
             return PyStageLinQError.INVALIDLENGTH
 
         # Verify frame type
+        magic_flag_start = start_offset + self.magic_flag_start
+        magic_flag_stop = start_offset + self.magic_flag_stop
         if (
-            frame[self.magic_flag_start : self.magic_flag_stop]
+            frame[magic_flag_start:magic_flag_stop]
             != StageLinQMessageIDs.StageLinQServiceAnnouncementData
         ):
             return PyStageLinQError.INVALIDFRAME
 
-        token_start = self.magic_flag_stop
+        token_start = magic_flag_stop
         token_stop = token_start + StageLinQToken.TOKENLENGTH
         service_name_start = token_stop
 
@@ -218,7 +220,7 @@ class StageLinQServiceAnnouncement(StageLinQMessage):
             return PyStageLinQError.INVALIDLENGTH
 
         self.Port = int.from_bytes(frame[port_start:port_stop], byteorder="big")
-        self.length = port_stop
+        self.length = port_stop - start_offset
         return PyStageLinQError.STAGELINQOK
 
     def get(self):
@@ -250,18 +252,20 @@ class StageLinQReference(StageLinQMessage):
         request_frame += reference_data.Reference.to_bytes(8, byteorder="big")
         return request_frame
 
-    def decode_frame(self, frame):
-        if len(frame) < self.length:
+    def decode_frame(self, frame, start_offset=0):
+        if len(frame) - start_offset < self.length:
             return PyStageLinQError.INVALIDLENGTH
 
         # Verify frame type
+        magic_flag_start = start_offset + self.magic_flag_start
+        magic_flag_stop = start_offset + self.magic_flag_stop
         if (
-            frame[self.magic_flag_start : self.magic_flag_stop]
+            frame[magic_flag_start:magic_flag_stop]
             != StageLinQMessageIDs.StageLinQReferenceData
         ):
             return PyStageLinQError.INVALIDFRAME
 
-        own_token_start = self.magic_flag_stop
+        own_token_start = magic_flag_stop
         own_token_stop = own_token_start + StageLinQToken.TOKENLENGTH
         device_token_start = own_token_stop
         device_token_stop = device_token_start + StageLinQToken.TOKENLENGTH
@@ -307,20 +311,23 @@ class StageLinQRequestServices(StageLinQMessage):
         )
         return request_frame
 
-    def decode_frame(self, frame):
+    def decode_frame(self, frame, start_offset=0):
         # Verify frame
-        if len(frame) < self.length:
+        if len(frame) - start_offset < self.length:
             return PyStageLinQError.INVALIDLENGTH
+        magic_flag_start = start_offset + self.magic_flag_start
+        magic_flag_stop = start_offset + self.magic_flag_stop
         if (
-            frame[self.magic_flag_start : self.magic_flag_stop]
+            frame[magic_flag_start:magic_flag_stop]
             != StageLinQMessageIDs.StageLinQServiceRequestData
         ):
             return PyStageLinQError.INVALIDFRAME
 
-        token_start = self.magic_flag_stop
+        token_start = magic_flag_stop
         token_stop = token_start + StageLinQToken.TOKENLENGTH
 
-        self.Token = frame[token_start:token_stop]
+        # Always bytes, frame may be a bytearray that is reused for the next frames
+        self.Token = bytes(frame[token_start:token_stop])
         return PyStageLinQError.STAGELINQOK
 
     def get(self):
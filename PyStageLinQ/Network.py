@@ -21,6 +21,8 @@ logger = logging.getLogger("PyStageLinQ")
 
 class StageLinQService:
     _loopcondition = True
+    # Maximum number of bytes read from the connection at a time
+    RECEIVESIZE = 65536
 
     def __init__(
         self,
@@ -41,15 +43,23 @@ class StageLinQService:
         self.device_name = discovery_frame.device_name
         self.device_token = discovery_frame.token
         self.sw_name = discovery_frame.sw_name
-
-        self.receive_task = asyncio.create_task(self.start_receive_data())
+        # Interface the device was discovered on, set by PyStageLinQ
+        self.interface = None
 
         self.init_complete = False
         self.services_available = False
+        # Set together with the flags above, so that waiters resume as soon as they change
+        self._init_event = asyncio.Event()
+        self._services_event = asyncio.Event()
+
+        self.receive_task = asyncio.create_task(self.start_receive_data())
+        # Also wakes up get_tasks if the connection fails before init completes
+        self.receive_task.add_done_callback(lambda _: self._init_event.set())
 
         self.service_found_callback = service_found_callback
 
-        self.remaining_data = None
+        # Received data that has not been decoded yet, frames are decoded from it in place
+        self.receive_buffer = bytearray()
 
         self.debug = []
 
@@ -71,23 +81,26 @@ class StageLinQService:
         return self.init_complete
 
     async def get_tasks(self) -> [asyncio.Task, asyncio.Task]:
-        while self.get_init_complete() is False:
-            await asyncio.sleep(0.1)
+        await self._init_event.wait()
+        if self.get_init_complete() is False:
+            # The connection failed before init completed
+            raise RuntimeError(
+                f"Could not connect to {self.device_name} at {self.Ip}:{self.Port}"
+            ) from (
+                None if self.receive_task.cancelled() else self.receive_task.exception()
+            )
         return [self.reference_task, self.receive_task]
 
     def get_services_available(self) -> bool:
         return self.services_available
 
     async def wait_for_services(self, timeout: float = -1.0) -> None:
-        timestep = 0.01
-        n = 0
-        while True:
-            if self.get_services_available() is True:
-                return
-            elif timeout >= 0 and n > timeout / timestep:
-                raise RuntimeError("Timeout occurred before services were received")
-            n = n + 1
-            await asyncio.sleep(timestep)
+        try:
+            await asyncio.wait_for(
+                self._services_event.wait(), timeout if timeout >= 0 else None
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError("Timeout occurred before services were received")
 
     async def send_request_frame(self) -> None:
         out_data = StageLinQRequestServices()
@@ -108,12 +121,21 @@ class StageLinQService:
         asyncio.create_task(self.send_request_frame())
 
         self.init_complete = True
+        self._init_event.set()
 
         await self._receive_data_loop()
 
     def get_loop_condition(self) -> bool:
         return self._loopcondition
 
+    def stop(self) -> None:
+        self._loopcondition = False
+        for task in [self.receive_task, self.reference_task]:
+            if task is not None:
+                task.cancel()
+        if self.writer is not None:
+            self.writer.close()
+
     async def _receive_data_loop(self) -> None:
         while self.get_loop_condition() is True:
             frames = await self._receive_frames()
@@ -133,20 +155,23 @@ class StageLinQService:
             | StageLinQServiceRequestService
         ]
     ):
-        response = await self.reader.read(1024)
+        response = await self.reader.read(self.RECEIVESIZE)
         if len(response) == 0:
             # Socket closed
             raise RuntimeError(
                 f"Remote socket for IP:{self.Ip} Port:{self.Port} closed!"
             )
 
-        if self.remaining_data is not None:
-            response = b"".join([self.remaining_data, response])
-        frames, self.remaining_data = self.decode_multiframe(response)
-        if frames is None:
-            # Something went wrong during decoding, lets throw away the frame and hope it doesn't happen again
+        self.receive_buffer += response
+        decoded = self.decode_multiframe(self.receive_buffer)
+        if decoded is None:
+            # Something went wrong during decoding, lets throw away the data and hope it doesn't happen again
             logger.debug(f"Error while decoding the frame")
+            self.receive_buffer.clear()
             return False
+        frames, decoded_length = decoded
+        # Decoded frames are removed once per read, a partial frame at the end is kept for the next read
+        del self.receive_buffer[:decoded_length]
         self.last_frame = response
         return frames
 
@@ -171,6 +196,7 @@ class StageLinQService:
 
     async def _handle_new_services(self) -> None:
         self.services_available = True
+        self._services_event.set()
         if self.service_found_callback is not None:
             await self.service_found_callback(self)
 
@@ -182,9 +208,13 @@ class StageLinQService:
             type(data_class) is StageLinQServiceRequestService
         ):
             if self.DeviceToken.get_token() == 0:
-                self.DeviceToken.set_token(
-                    int.from_bytes(data_class.Token, byteorder="big")
-                )
+                # Service announcements are decoded to a token, service requests keep the raw bytes
+                if type(data_class.Token) is Token.StageLinQToken:
+                    self.DeviceToken.set_token(data_class.Token.get_token())
+                else:
+                    self.DeviceToken.set_token(
+                        int.from_bytes(data_class.Token, byteorder="big")
+                    )
 
     async def send_reference_message_periodically(self) -> None:
         while self.get_loop_condition():
@@ -206,11 +236,17 @@ class StageLinQService:
 
     @staticmethod
     def decode_multiframe(
-        frame: bytes,
-    ) -> tuple[list[Any], None | bytes] | None:
+        frame: bytes | bytearray,
+    ) -> tuple[list[Any], int] | None:
+        """
+        Decodes all complete frames in frame. Returns the decoded frames and the number of bytes they used, the
+        remaining bytes are the start of a frame that has not been fully received yet.
+        """
         subframes = []
-        while len(frame) >= 4:
-            match (int.from_bytes(frame[0:4], byteorder="big")):
+        # Frames are decoded at their offset, so that the remaining data is not copied for every frame
+        offset = 0
+        while len(frame) - offset >= 4:
+            match (int.from_bytes(frame[offset : offset + 4], byteorder="big")):
                 case 0:
                     data = StageLinQServiceAnnouncement()
                 case 1:
@@ -220,15 +256,15 @@ class StageLinQService:
                 case _:
                     # invalid data, return
                     return None
-            decode_status = data.decode_frame(frame)
+            decode_status = data.decode_frame(frame, offset)
 
             if decode_status != PyStageLinQError.STAGELINQOK:
                 if decode_status == PyStageLinQError.INVALIDLENGTH:
-                    return subframes, frame
+                    return subframes, offset
                 else:
                     return None
 
             subframes.append(data.get())
-            frame = frame[data.get_len() :]
+            offset += data.get_len()
 
-        return subframes, None
+        return subframes, offset
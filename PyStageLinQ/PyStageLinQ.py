@@ -3,7 +3,6 @@
 This code is licensed under MIT license (see LICENSE for details)
 """
 
-import select
 import socket
 import time
 import asyncio
@@ -11,10 +10,13 @@ import logging
 import platform
 import psutil
 import ipaddress
+import itertools
 import os
+from dataclasses import replace
 from typing import Callable
 
 from . import Device
+from .Cache import LRUCache
 from .MessageClasses import *
 from .DataClasses import *
 from .ErrorCodes import PyStageLinQError
@@ -23,6 +25,9 @@ from . import EngineServices
 
 logger = logging.getLogger("PyStageLinQ")
 
+# Marks a remote IP that has not been looked up yet, as None is a valid lookup result
+_NOT_CACHED = object()
+
 
 @dataclass
 class PyStageLinQ_interface_info:
@@ -36,9 +41,18 @@ class PyStageLinQ_interface_info:
 
 
 class PyStageLinQ_network_interface:
+    remote_ip_cache_size = 256
+
     def __init__(self, ip=None, discovery_port=51337):
         self.target_interfaces = []
+        # One bound broadcast socket per interface, kept open between discovery frames
+        self.discovery_sockets = {}
         self.discovery_port = discovery_port
+        self._ip_list = []
+        # Ids are never reused, so a removed interface cannot hand its pooled socket to a new one
+        self._interface_ids = itertools.count()
+        self._interface_index = []
+        self._remote_ip_cache = LRUCache(self.remote_ip_cache_size)
         self.get_interface_from_ip(ip)
 
     def get_interface_from_ip(self, ip):
@@ -53,27 +67,14 @@ class PyStageLinQ_network_interface:
             ip_list = ip
         else:
             raise TypeError
-        logger.info(
-            f"Found {len(psutil.net_if_stats().items())} total network interfaces, listing IPv4 interfaces:"
-        )
+        self._ip_list = ip_list
 
-        for interface in psutil.net_if_stats().items():
-            for interface_info in psutil.net_if_addrs()[interface[0]]:
-                # Only look for IPV4 binds
-                if socket.AF_INET == interface_info.family:
-                    logger.info(f"  - {interface[0]}: {interface_info.address}")
-                    if interface_info.address in ip_list or ip_list[0] == "any":
-                        self.target_interfaces.append(
-                            PyStageLinQ_interface_info(
-                                interface[0],
-                                len(self.target_interfaces),
-                                int(ipaddress.IPv4Address(interface_info.address)),
-                                interface_info.address,
-                                int(ipaddress.IPv4Address(interface_info.netmask)),
-                                interface[1],
-                                0,
-                            )
-                        )
+        self.target_interfaces = [
+            self._create_interface_info(interface_key, interface_status)
+            for interface_key, interface_status in self._enumerate_interfaces(
+                log_interfaces=True
+            ).items()
+        ]
 
         logger.info(
             f"{len(self.target_interfaces)} interfaces matched with requested interfaces and will be used by PyStageLinQ:"
@@ -81,34 +82,154 @@ class PyStageLinQ_network_interface:
         for iface in self.target_interfaces:
             logger.info(f"  - {iface.name}: {iface.addr_str}")
 
+        self._build_interface_index()
+
+    def _enumerate_interfaces(self, log_interfaces=False):
+        """
+        Returns the status of every requested interface that is up, keyed by name, address and mask.
+        """
+        # Both are read once per enumeration, they are system calls that walk every interface
+        interface_stats = psutil.net_if_stats()
+        interface_addrs = psutil.net_if_addrs()
+        if log_interfaces:
+            logger.info(
+                f"Found {len(interface_stats)} total network interfaces, listing IPv4 interfaces:"
+            )
+
+        interfaces = {}
+        for interface_name, interface_status in interface_stats.items():
+            for interface_info in interface_addrs.get(interface_name, []):
+                # Only look for IPV4 binds
+                if socket.AF_INET != interface_info.family:
+                    continue
+                if log_interfaces:
+                    logger.info(f"  - {interface_name}: {interface_info.address}")
+                if not interface_status.isup:
+                    # Treated as removed until it comes up again
+                    continue
+                if interface_info.address in self._ip_list or self._ip_list[0] == "any":
+                    interface_key = (
+                        interface_name,
+                        interface_info.address,
+                        int(ipaddress.IPv4Address(interface_info.netmask)),
+                    )
+                    interfaces[interface_key] = interface_status
+        return interfaces
+
+    def _create_interface_info(self, interface_key, interface_status):
+        interface_name, address, mask = interface_key
+        return PyStageLinQ_interface_info(
+            interface_name,
+            next(self._interface_ids),
+            int(ipaddress.IPv4Address(address)),
+            address,
+            mask,
+            interface_status,
+            0,
+        )
+
+    def refresh_interfaces(self):
+        """
+        Enumerates the interfaces again and applies the difference to target_interfaces. Interfaces that are still
+        present keep their sockets and counters, sockets of removed interfaces are closed.
+
+        :return: Tuple of the added and removed interfaces.
+        """
+        current = {
+            (interface.name, interface.addr_str, interface.mask): interface
+            for interface in self.target_interfaces
+        }
+        snapshot = self._enumerate_interfaces()
+
+        # Only interfaces that are new get an id, ids of existing interfaces must not change
+        added = [
+            self._create_interface_info(key, interface_status)
+            for key, interface_status in snapshot.items()
+            if key not in current
+        ]
+        removed = [
+            interface for key, interface in current.items() if key not in snapshot
+        ]
+        if not added and not removed:
+            return added, removed
+
+        for interface in removed:
+            logger.info(f"Interface removed: {interface.name}: {interface.addr_str}")
+            self._close_discovery_socket(interface)
+            self.target_interfaces.remove(interface)
+        for interface in added:
+            logger.info(f"Interface added: {interface.name}: {interface.addr_str}")
+            self.target_interfaces.append(interface)
+
+        self._build_interface_index()
+        return added, removed
+
     def send_discovery_frame(self, discovery_frame):
         for interface in self.target_interfaces:
             try:
-                with socket.socket(
-                    socket.AF_INET, socket.SOCK_DGRAM
-                ) as discovery_socket:
-                    discovery_socket.setsockopt(
-                        socket.SOL_SOCKET, socket.SO_BROADCAST, 1
-                    )
-                    discovery_socket.bind((interface.addr_str, 0))
-                    discovery_socket.sendto(
-                        discovery_frame,
-                        ("255.255.255.255", self.discovery_port),
-                    )
-                    self.target_interfaces[interface.id].n_disc_msg_send += 1
+                self._get_discovery_socket(interface).sendto(
+                    discovery_frame,
+                    ("255.255.255.255", self.discovery_port),
+                )
+                interface.n_disc_msg_send += 1
             except Exception as e:
                 logger.debug(
                     f"Cannot send discovery on interface {interface.name} ({interface.addr_str}): {e}"
                 )
+                # Socket is rebuilt on next discovery frame
+                self._close_discovery_socket(interface)
 
-    def determine_interface_of_remote_ip(self, ip):
+    def _get_discovery_socket(self, interface):
+        discovery_socket = self.discovery_sockets.get(interface.id)
+        if discovery_socket is not None:
+            return discovery_socket
+
+        discovery_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            discovery_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            discovery_socket.bind((interface.addr_str, 0))
+        except Exception:
+            discovery_socket.close()
+            raise
+
+        self.discovery_sockets[interface.id] = discovery_socket
+        return discovery_socket
+
+    def _close_discovery_socket(self, interface):
+        discovery_socket = self.discovery_sockets.pop(interface.id, None)
+        if discovery_socket is not None:
+            discovery_socket.close()
+
+    def close_discovery_sockets(self):
         for interface in self.target_interfaces:
-            if (int(ipaddress.IPv4Address(ip)) & interface.mask) == (
-                interface.mask & interface.addr
-            ):
-                return interface
+            self._close_discovery_socket(interface)
+
+    def _build_interface_index(self):
+        # Longest prefix first, so the most specific subnet matches a remote IP
+        self._interface_index = sorted(
+            (
+                (interface.mask, interface.addr & interface.mask, interface)
+                for interface in self.target_interfaces
+            ),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        self._remote_ip_cache.clear()
+
+    def determine_interface_of_remote_ip(self, ip):
+        interface = self._remote_ip_cache.get(ip, _NOT_CACHED)
+        if interface is not _NOT_CACHED:
+            return interface
 
-        return None
+        remote_addr = int(ipaddress.IPv4Address(ip))
+        interface = None
+        for mask, network, candidate in self._interface_index:
+            if remote_addr & mask == network:
+                interface = candidate
+                break
+
+        self._remote_ip_cache.put(ip, interface)
+        return interface
 
     def send_desc_on_all_if(self):
         # Check if at least one working interface has sent 3+ discovery messages
@@ -120,6 +241,45 @@ class PyStageLinQ_network_interface:
         return any_working
 
 
+class PyStageLinQ_discovery_protocol(asyncio.DatagramProtocol):
+    """
+    Receives StageLinQ discovery frames. Every datagram is decoded as soon as the event loop reports it, valid frames
+    are handed to frame_received_callback together with the IP of the sender.
+
+    StageLinQ devices repeat the exact same announcement about once per second, so decoded frames are kept in an LRU
+    keyed on the raw datagram. A repeated announcement is then recognized with a single lookup.
+    """
+
+    frame_cache_size = 64
+
+    def __init__(
+        self, frame_received_callback: Callable[[StageLinQDiscovery, str], None]
+    ):
+        self.frame_received_callback = frame_received_callback
+        self.frame_cache = LRUCache(self.frame_cache_size)
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        discovery_frame = self.frame_cache.get(data)
+
+        if discovery_frame is None:
+            discovery_frame = StageLinQDiscovery()
+
+            if PyStageLinQError.STAGELINQOK != discovery_frame.decode_frame(data):
+                # something went wrong
+                return
+
+            self.frame_cache.put(data, discovery_frame)
+
+        self.frame_received_callback(discovery_frame, addr[0])
+
+    def error_received(self, exc):
+        logger.debug(f"Error on discovery socket: {exc}")
+
+
 class PyStageLinQ:
     """
     The main object for PyStageLinQ. Use this object to first initialize and then start PyStageLinq
@@ -134,10 +294,29 @@ class PyStageLinQ:
     :param ip: This is the ip of the interface you want to bind the sockets to, e.g. your local ethernet IP. If set to
     None all interfaces will be used.
 
+    :param device_lost_callback: This callback is used to report back to the application when a StageLinQ device has
+    stopped announcing itself or has announced that it is shutting down. The device is disconnected and will be
+    reported through new_device_found_callback again if it comes back.
+
+    :param device_lost_timeout: Time in seconds a device may go without announcing itself before it is considered
+    lost. Defaults to 5 seconds.
+
+    :param interface_poll_interval: Time in seconds between checks for added or removed network interfaces, e.g. a USB
+    network adapter being plugged in. Defaults to 5 seconds.
+
+    :param fast_start: If set to True PyStageLinQ starts listening for StageLinQ devices right away instead of first
+    sending three announcements. The first announcements are sent 50 ms apart instead of 500 ms, and only service
+    requests are held back until they have been sent, as StageLinQ devices reject service requests from devices they
+    have not seen announce themselves. Defaults to False.
+
     """
 
     REQUESTSERVICEPORT = 0  # If set to anything but 0 other StageLinQ devices will try to request services at said port
     StageLinQ_discovery_port = 51337
+    # Received discovery frames waiting to be handled, further frames are dropped
+    DISCOVERYQUEUESIZE = 256
+    # Time between the first announcements when fast_start is used
+    FASTSTARTANNOUNCEMENTINTERVAL = 0.05
 
     _loopcondition = True
 
@@ -148,6 +327,10 @@ class PyStageLinQ:
         ],
         name: str = "Hello StageLinQ World",
         ip=None,
+        device_lost_callback: Callable[[str, StageLinQDiscovery], None] = None,
+        device_lost_timeout: float = 5.0,
+        interface_poll_interval: float = 5.0,
+        fast_start: bool = False,
     ):
         self.name = name
         self.OwnToken = StageLinQToken()
@@ -160,16 +343,28 @@ class PyStageLinQ:
             SwVersion="0.0.1",
             ReqServicePort=self.REQUESTSERVICEPORT,
         )
+        self._discovery_frames = {}
+        self._discovery_frames_key = None
+        self.fast_start = fast_start
+        self._announcements_sent = asyncio.Event()
 
         self.device_list = Device.DeviceList()
+        self.device_liveness = Device.DeviceLivenessTracker(device_lost_timeout)
+        self._announced_devices = {}
+        # Registration in flight for every device, so repeated announcements do not connect again
+        self._registration_tasks = {}
 
         self.network_interface = PyStageLinQ_network_interface(ip)
+        self.interface_poll_interval = interface_poll_interval
+        # Discovery task for every address a discovery socket is bound to
+        self._discovery_tasks = {}
 
         self.tasks = set()
 
         self.active_services = []
 
         self.new_device_found_callback = new_device_found_callback
+        self.device_lost_callback = device_lost_callback
 
         logger.debug(f"Initialized!")
 
@@ -193,19 +388,41 @@ class PyStageLinQ:
 
     def _stop(self):
         logger.info(f"Stop requested, trying graceful shutdown")
-        discovery = StageLinQDiscovery()
-        discovery_info = self.discovery_info
-        discovery_info.ConnectionType = ConnectionTypes.EXIT
-        discovery_frame = discovery.encode_frame(discovery_info)
+        # Stop the periodic announcements first, so no HOWDY is sent after EXIT or reopens the discovery sockets
+        self._loopcondition = False
+        discovery_frame = self._get_discovery_frame(ConnectionTypes.EXIT)
 
         self.network_interface.send_discovery_frame(discovery_frame)
+        self.network_interface.close_discovery_sockets()
         logger.info(f"Gracefully shutdown complete")
 
     def _announce_self(self):
-        discovery = StageLinQDiscovery()
-        discovery_frame = discovery.encode_frame(self.discovery_info)
+        discovery_frame = self._get_discovery_frame(ConnectionTypes.HOWDY)
         self.network_interface.send_discovery_frame(discovery_frame)
 
+    def _get_discovery_frame(self, connection_type: str) -> bytes:
+        # Encoded frames are reused until anything but the connection type of discovery_info changes
+        discovery_info = self.discovery_info
+        frames_key = (
+            discovery_info.DeviceName,
+            discovery_info.SwName,
+            discovery_info.SwVersion,
+            discovery_info.ReqServicePort,
+            discovery_info.Token.get_token(),
+        )
+        if frames_key != self._discovery_frames_key:
+            self._discovery_frames = {}
+            self._discovery_frames_key = frames_key
+
+        discovery_frame = self._discovery_frames.get(connection_type)
+        if discovery_frame is None:
+            discovery_frame = StageLinQDiscovery().encode_frame(
+                replace(discovery_info, ConnectionType=connection_type)
+            )
+            self._discovery_frames[connection_type] = discovery_frame
+
+        return discovery_frame
+
     def get_loop_condition(self) -> bool:
         return self._loopcondition
 
@@ -216,17 +433,12 @@ class PyStageLinQ:
 
         logger.info(f"Trying to discover StageLinQ devices.")
 
-        # Local Constants
-        discover_buffer_size = 8192
-
         # Create socket
         discover_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-        bind_ip = "" if os.name == "posix" else host_ip
-
         try:
             discover_socket.bind(
-                (bind_ip, self.StageLinQ_discovery_port)
+                (host_ip, self.StageLinQ_discovery_port)
             )  # bind socket to broadcast
         except Exception as e:
             # Cannot bind to socket, check if IP is correct and link is up
@@ -236,61 +448,206 @@ class PyStageLinQ:
             return PyStageLinQError.CANNOTBINDSOCKET
         discover_socket.setblocking(False)
 
-        loop_timeout = time.time() + timeout
+        # Frames are decoded by the protocol as soon as they arrive and queued up here
+        discovery_queue = asyncio.Queue(maxsize=self.DISCOVERYQUEUESIZE)
+        discovery_transport = await self._create_discovery_endpoint(
+            discover_socket,
+            lambda frame, ip: self._queue_discovery_frame(discovery_queue, frame, ip),
+        )
+
+        loop_timeout = None if timeout is None else time.time() + timeout
 
         logger.debug(
             f"Socket bound to IP {host_ip} and Port {self.StageLinQ_discovery_port} successfully. Starting to look for "
             f"discovery frames"
         )
 
-        while self.get_loop_condition():
-            data_available = select.select([discover_socket], [], [], 0)
-            if data_available[0]:
-                data, addr = discover_socket.recvfrom(discover_buffer_size)
-                device_ip = addr[0]
-                discovery_frame = StageLinQDiscovery()
-
-                if PyStageLinQError.STAGELINQOK != discovery_frame.decode_frame(data):
-                    # something went wrong
-                    continue
+        try:
+            while self.get_loop_condition():
+                try:
+                    discovery_frame, device_ip = await asyncio.wait_for(
+                        discovery_queue.get(),
+                        None if loop_timeout is None else loop_timeout - time.time(),
+                    )
+                except asyncio.TimeoutError:
+                    # No devices found within timeout
+                    logger.info(
+                        f"No discovery frames found on {host_ip} last {timeout} seconds."
+                    )
+                    return PyStageLinQError.DISCOVERYTIMEOUT
 
-                if self.name == discovery_frame.device_name:
-                    # Ourselves, ignore message
+                if not await self._handle_discovery_frame(discovery_frame, device_ip):
                     continue
 
-                if 0 == discovery_frame.Port:
-                    # If port is 0 there are no services to request, and for our use an invalid device
-                    continue
+                if timeout is not None:
+                    # External Device present, setting new timeout
+                    loop_timeout = time.time() + timeout
+        finally:
+            discovery_transport.close()
 
-                # External Device present, setting new timeout
-                loop_timeout = time.time() + timeout
+    @staticmethod
+    def _queue_discovery_frame(discovery_queue, discovery_frame, ip):
+        try:
+            discovery_queue.put_nowait((discovery_frame, ip))
+        except asyncio.QueueFull:
+            # Devices announce themselves every 500 ms, so a dropped frame is sent again soon
+            logger.debug(f"Discovery queue full, dropping discovery frame from {ip}")
 
-                # Check if we have already registered this device, and if so ignore it for now
-                device_registered = self.device_list.find_registered_device(
-                    discovery_frame.get()
-                )
-                if device_registered is True:
-                    continue
+    async def _handle_discovery_frame(self, discovery_frame, device_ip) -> bool:
+        """
+        Handles a discovery frame, returns True if it was sent by an external StageLinQ device.
+        """
+        if self.name == discovery_frame.device_name:
+            # Ourselves, ignore message
+            return False
 
-                logger.info(f"Found new StageLinq device at IP {device_ip}")
-                await self._register_new_device(discovery_frame, device_ip)
+        if 0 == discovery_frame.Port:
+            # If port is 0 there are no services to request, and for our use an invalid device
+            return False
 
-            if time.time() > loop_timeout:
-                # No devices found within timeout
-                logger.info(
-                    f"No discovery frames found on {host_ip} last {timeout} seconds."
-                )
-                return PyStageLinQError.DISCOVERYTIMEOUT
-            await asyncio.sleep(0.1)
+        # Discovery sockets may receive broadcasts from every interface, only accept devices on the ones we use
+        interface = self.network_interface.determine_interface_of_remote_ip(device_ip)
+        if interface is None:
+            logger.debug(
+                f"Ignoring discovery frame from {device_ip}, not on any used interface"
+            )
+            return False
+
+        # Repeated frames from known devices are looked up without building a StageLinQDiscoveryData
+        device = self.device_list.get_device_by_name_port(
+            discovery_frame.device_name, discovery_frame.Port
+        )
+        if device is not None:
+            if discovery_frame.connection_type == ConnectionTypes.EXIT:
+                self._device_lost(discovery_frame, device_ip)
+                return True
+
+            if device.device_token.get_token() == discovery_frame.token.get_token():
+                self._device_seen(discovery_frame, device_ip, interface)
+                return True
+
+            # Same device announcing a new token, it has been restarted so register it again
+            self._device_lost(discovery_frame, device_ip)
+
+        if discovery_frame.connection_type == ConnectionTypes.EXIT:
+            return True
+
+        # Check if we have already registered this device, and if so ignore it for now
+        device_registered = self.device_list.find_registered_device(
+            discovery_frame.get()
+        )
+        if device_registered is True:
+            return True
+
+        device_key = self._get_device_key(discovery_frame)
+        if device_key in self._registration_tasks:
+            return True
+
+        logger.info(
+            f"Found new StageLinq device at IP {device_ip} on interface {interface.name}"
+        )
+        # Connecting to the device must not hold up the frames of other devices
+        self._registration_tasks[device_key] = asyncio.create_task(
+            self._register_device_task(discovery_frame, device_ip, interface)
+        )
+        return True
+
+    async def _register_device_task(self, discovery_frame, ip, interface):
+        device_key = self._get_device_key(discovery_frame)
+        try:
+            await self._register_new_device(discovery_frame, ip, interface)
+        except (OSError, RuntimeError) as e:
+            logger.warning(
+                f"Could not register StageLinQ device at IP {ip}, retrying on next announcement: {e}"
+            )
+            return
+        finally:
+            self._registration_tasks.pop(device_key, None)
+        self._device_seen(discovery_frame, ip, interface)
+
+    @staticmethod
+    def _get_device_key(discovery_frame) -> tuple[str, int]:
+        return discovery_frame.device_name, discovery_frame.Port
+
+    def _device_seen(self, discovery_frame, ip, interface):
+        device_key = self._get_device_key(discovery_frame)
+        self._announced_devices[device_key] = (discovery_frame, ip, interface)
+        self.device_liveness.seen(device_key, time.monotonic())
+
+    def _device_lost(self, discovery_frame, ip):
+        device_key = self._get_device_key(discovery_frame)
+        self._announced_devices.pop(device_key, None)
+        self.device_liveness.forget(device_key)
+
+        device = self.device_list.get_device_by_name_port(
+            discovery_frame.device_name, discovery_frame.Port
+        )
+        if device is not None:
+            self.device_list.unregister_device(device)
+            self._stop_device(device)
+
+        logger.info(f"Lost StageLinQ device {discovery_frame.device_name} at IP {ip}")
+        if self.device_lost_callback is not None:
+            self.device_lost_callback(ip, discovery_frame)
+
+    def _stop_device(self, device):
+        device.stop()
+        self.tasks.difference_update([device.receive_task, device.reference_task])
+
+        for state_map in self.active_services.copy():
+            if (
+                state_map.service_handle.ip == device.Ip
+                and state_map.service_handle.device == device.device_name
+            ):
+                state_map.stop()
+                self.tasks.discard(state_map.get_task())
+                self.active_services.remove(state_map)
+
+    async def _device_liveness_monitor(self):
+        while self.get_loop_condition():
+            # Only wake up when the first device may have been lost
+            next_deadline = self.device_liveness.next_deadline()
+            if next_deadline is None:
+                await asyncio.sleep(self.device_liveness.timeout)
+            else:
+                await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
+
+            for device_key in self.device_liveness.pop_lost(time.monotonic()):
+                discovery_frame, ip, _ = self._announced_devices[device_key]
+                self._device_lost(discovery_frame, ip)
+
+    @staticmethod
+    async def _create_discovery_endpoint(discover_socket, frame_received_callback):
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: PyStageLinQ_discovery_protocol(frame_received_callback),
+            sock=discover_socket,
+        )
+        return transport
+
+    async def _register_new_device(self, discovery_frame, ip, interface=None):
+        if not self._announcements_sent.is_set():
+            # StageLinQ devices reject service requests until they have seen us announce ourselves
+            logger.debug(
+                f"Waiting for announcements to be sent before requesting services"
+            )
+            await self._announcements_sent.wait()
 
-    async def _register_new_device(self, discovery_frame, ip):
         stagelinq_device = StageLinQService(ip, discovery_frame, self.OwnToken, None)
-        service_tasks = await stagelinq_device.get_tasks()
-        for task in service_tasks:
-            self.tasks.add(task)
-        self.device_list.register_device(stagelinq_device)
-        logging.debug(f"Device found! Name: {stagelinq_device.device_name}")
-        await stagelinq_device.wait_for_services(timeout=1)
+        stagelinq_device.interface = interface
+        try:
+            service_tasks = await stagelinq_device.get_tasks()
+            for task in service_tasks:
+                self.tasks.add(task)
+            self.device_list.register_device(stagelinq_device)
+            logging.debug(f"Device found! Name: {stagelinq_device.device_name}")
+            await stagelinq_device.wait_for_services(timeout=1)
+        except Exception:
+            # Leave the device unregistered so that its next announcement tries again
+            self.device_list.unregister_device(stagelinq_device)
+            self._stop_device(stagelinq_device)
+            raise
+
         if self.new_device_found_callback is not None:
             self.new_device_found_callback(
                 ip, discovery_frame, stagelinq_device.get_services()
@@ -329,17 +686,22 @@ class PyStageLinQ:
         await state_map.subscribe(self.OwnToken)
 
         self.tasks.add(state_map.get_task())
+        self.active_services.append(state_map)
         logger.debug(f"Subscription to StateMap successful.")
 
     async def _start_stagelinq(self, standalone=False):
         # Start the initial tasks of the library
         self.tasks.add(asyncio.create_task(self._periodic_announcement()))
 
-        # wait for discovery message to be send on all interfaces
-        while not self.network_interface.send_desc_on_all_if():
-            await asyncio.sleep(0.1)
+        if not self.fast_start:
+            # wait for discovery message to be send on all interfaces
+            while not self.network_interface.send_desc_on_all_if():
+                await asyncio.sleep(0.1)
+            self._announcements_sent.set()
 
         self.tasks.add(asyncio.create_task(self._py_stagelinq_strapper()))
+        self.tasks.add(asyncio.create_task(self._device_liveness_monitor()))
+        self.tasks.add(asyncio.create_task(self._interface_watcher()))
 
         if standalone:
             await self._wait_for_exit()
@@ -363,29 +725,68 @@ class PyStageLinQ:
         logger.info(f"Stop all PyStageLinQ AsyncIO tasks requested")
         for task in self.tasks.copy():
             task.cancel()
+        for task in self._discovery_tasks.values():
+            task.cancel()
+        self._discovery_tasks.clear()
+        for task in self._registration_tasks.values():
+            task.cancel()
+        self._registration_tasks.clear()
 
     async def _periodic_announcement(self):
         while self.get_loop_condition():
             self._announce_self()
-            await asyncio.sleep(0.5)
+            if (
+                not self._announcements_sent.is_set()
+                and self.network_interface.send_desc_on_all_if()
+            ):
+                self._announcements_sent.set()
+
+            if self.fast_start and not self._announcements_sent.is_set():
+                # Send the first announcements back to back so service requests are not held back for long
+                await asyncio.sleep(self.FASTSTARTANNOUNCEMENTINTERVAL)
+            else:
+                await asyncio.sleep(0.5)
+
+    def _get_discovery_bind_ips(self) -> list[str]:
+        if os.name == "posix":
+            # A socket bound to "" receives the broadcasts of all interfaces, so one socket and decoder is enough
+            return [""]
+        return [
+            interface.addr_str for interface in self.network_interface.target_interfaces
+        ]
+
+    def _update_discovery_tasks(self):
+        discovery_ips = self._get_discovery_bind_ips()
+
+        for discovery_ip in list(self._discovery_tasks):
+            if discovery_ip not in discovery_ips:
+                logger.info(f"Stopped looking for discovery frames on {discovery_ip}")
+                self._discovery_tasks.pop(discovery_ip).cancel()
+
+        for discovery_ip in discovery_ips:
+            if discovery_ip not in self._discovery_tasks:
+                logger.info(
+                    f"Looking for discovery frames on {discovery_ip or 'all interfaces'}"
+                )
+                self._discovery_tasks[discovery_ip] = asyncio.create_task(
+                    self._discover_stagelinq_device(discovery_ip, timeout=None)
+                )
 
-    async def _py_stagelinq_strapper(self):
-        strapper_tasks = set()
-        logger.info(
-            f"Looking for discovery frames on {len(self.network_interface.target_interfaces)} IP addresses:"
-        )
+    async def _interface_watcher(self):
+        while self.get_loop_condition():
+            await asyncio.sleep(self.interface_poll_interval)
 
-        for interface in self.network_interface.target_interfaces:
-            logger.info(f"{interface.addr_str}")
-            strapper_tasks.add(
-                asyncio.create_task(
-                    self._discover_stagelinq_device(interface.addr_str, timeout=2)
-                )
-            )
+            added, removed = self.network_interface.refresh_interfaces()
+            if added or removed:
+                self._update_discovery_tasks()
+
+    async def _py_stagelinq_strapper(self):
+        self._update_discovery_tasks()
 
         while self.get_loop_condition():
-            all_tasks_done = True
-            for task in strapper_tasks.copy():
+            # Interfaces may be added later, so keep waiting while there is nothing to discover on
+            all_tasks_done = len(self._discovery_tasks) > 0
+            for task in list(self._discovery_tasks.values()):
                 all_tasks_done = all_tasks_done and task.done()
                 if task.done():
                     if task.exception() is not None:
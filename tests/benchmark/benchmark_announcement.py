@@ -0,0 +1,52 @@
+"""
+(c) 2022 Jaxcie
+This code is licensed under MIT license (see LICENSE for details)
+
+Microbenchmark of the announcement path of PyStageLinQ, i.e. what _announce_self does every 500 ms before the frame
+is handed to the network interface. Sending is stubbed out so only the cost of producing the frame is measured.
+
+"before" encodes a new StageLinQDiscovery on every announcement, which is what _announce_self used to do. "after"
+calls _announce_self, which reuses the cached frame.
+
+Run from the repository root:
+    PYTHONPATH=. python tests/benchmark/benchmark_announcement.py
+"""
+
+import timeit
+
+from PyStageLinQ.PyStageLinQ import PyStageLinQ
+from PyStageLinQ.MessageClasses import StageLinQDiscovery
+
+ITERATIONS = 100000
+
+
+class NetworkInterfaceStub:
+    target_interfaces = []
+
+    def send_discovery_frame(self, discovery_frame):
+        pass
+
+    def close_discovery_sockets(self):
+        pass
+
+
+def main():
+    pystagelinq = PyStageLinQ(None, ip="127.0.0.1")
+    pystagelinq.network_interface = NetworkInterfaceStub()
+
+    def announce_self_before():
+        discovery = StageLinQDiscovery()
+        discovery_frame = discovery.encode_frame(pystagelinq.discovery_info)
+        pystagelinq.network_interface.send_discovery_frame(discovery_frame)
+
+    before = timeit.timeit(announce_self_before, number=ITERATIONS)
+    after = timeit.timeit(pystagelinq._announce_self, number=ITERATIONS)
+
+    print(f"Announcement path, {ITERATIONS} iterations:")
+    print(f"before (encode every time): {before / ITERATIONS * 1e6:8.3f} us/announce")
+    print(f"after (cached frame):       {after / ITERATIONS * 1e6:8.3f} us/announce")
+    print(f"speedup:                    {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+(c) 2022 Jaxcie
+This code is licensed under MIT license (see LICENSE for details)
+
+Benchmark of the time from a discovery frame being sent until PyStageLinQ hands the new device on for registration.
+
+The discovery task of PyStageLinQ (_discover_stagelinq_device) runs for real, with its datagram endpoint, queue and
+frame handling, and only _register_new_device is stubbed out to take the timestamp. It is compared against a copy of
+the previous implementation, which polled the socket with select and slept for 100 ms between polls. Frames are sent
+over loopback at random points in time, just like a StageLinQ device would announce itself independently of when
+PyStageLinQ looks for it.
+
+Run from the repository root:
+    PYTHONPATH=. python tests/benchmark/benchmark_discovery_latency.py
+"""
+
+import asyncio
+import random
+import select
+import socket
+import statistics
+import time
+
+from PyStageLinQ.PyStageLinQ import PyStageLinQ
+from PyStageLinQ.MessageClasses import StageLinQDiscovery, ConnectionTypes
+from PyStageLinQ.DataClasses import StageLinQDiscoveryData
+from PyStageLinQ.ErrorCodes import PyStageLinQError
+from PyStageLinQ.Token import StageLinQToken
+
+SAMPLES = 50
+
+
+def make_discovery_frame() -> bytes:
+    token = StageLinQToken()
+    token.generate_token()
+    return StageLinQDiscovery().encode_frame(
+        StageLinQDiscoveryData(
+            Token=token,
+            DeviceName="Benchmark Device",
+            ConnectionType=ConnectionTypes.HOWDY,
+            SwName="JP11",
+            SwVersion="3.0.0",
+            ReqServicePort=50010,
+        )
+    )
+
+
+def get_free_port() -> int:
+    probe_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe_socket.bind(("127.0.0.1", 0))
+    port = probe_socket.getsockname()[1]
+    probe_socket.close()
+    return port
+
+
+def make_sockets():
+    receive_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receive_socket.bind(("127.0.0.1", 0))
+    receive_socket.setblocking(False)
+    send_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return receive_socket, send_socket
+
+
+async def send_frames(send_socket, address, frame, send_times):
+    for _ in range(SAMPLES):
+        await asyncio.sleep(random.uniform(0.0, 0.1))
+        send_times.append(time.perf_counter())
+        send_socket.sendto(frame, address)
+
+
+async def measure_select_polling(frame) -> list[float]:
+    receive_socket, send_socket = make_sockets()
+    send_times = []
+    latencies = []
+    sender = asyncio.create_task(
+        send_frames(send_socket, receive_socket.getsockname(), frame, send_times)
+    )
+
+    while len(latencies) < SAMPLES:
+        data_available = select.select([receive_socket], [], [], 0)
+        if data_available[0]:
+            data, addr = receive_socket.recvfrom(8192)
+            discovery_frame = StageLinQDiscovery()
+            if PyStageLinQError.STAGELINQOK == discovery_frame.decode_frame(data):
+                latencies.append(time.perf_counter() - send_times[len(latencies)])
+            continue
+        await asyncio.sleep(0.1)
+
+    await sender
+    receive_socket.close()
+    send_socket.close()
+    return latencies
+
+
+async def measure_discovery_task(frame) -> list[float]:
+    send_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    send_times = []
+    latencies = []
+
+    async def register_new_device(discovery_frame, ip, interface=None):
+        latencies.append(time.perf_counter() - send_times[len(latencies)])
+
+    pystagelinq = PyStageLinQ(None, name="Benchmark", ip="127.0.0.1")
+    # Registration is stubbed out, it is where a new device is handed on once discovery is done with it
+    pystagelinq._register_new_device = register_new_device
+    pystagelinq.StageLinQ_discovery_port = get_free_port()
+    discovery_task = asyncio.create_task(
+        pystagelinq._discover_stagelinq_device("127.0.0.1", timeout=None)
+    )
+    # Let the discovery task bind its socket
+    await asyncio.sleep(0.1)
+
+    await send_frames(
+        send_socket,
+        ("127.0.0.1", pystagelinq.StageLinQ_discovery_port),
+        frame,
+        send_times,
+    )
+    while len(latencies) < SAMPLES:
+        await asyncio.sleep(0.01)
+
+    discovery_task.cancel()
+    send_socket.close()
+    return latencies
+
+
+def report(name, latencies):
+    latencies_us = sorted(latency * 1e6 for latency in latencies)
+    print(
+        f"{name:<20} median: {statistics.median(latencies_us):>10.1f} us   "
+        f"p95: {latencies_us[int(len(latencies_us) * 0.95) - 1]:>10.1f} us   "
+        f"max: {latencies_us[-1]:>10.1f} us"
+    )
+
+
+async def main():
+    frame = make_discovery_frame()
+    print(f"Discovery-to-registration latency over {SAMPLES} frames on loopback:")
+    report("select + sleep(0.1)", await measure_select_polling(frame))
+    report("discovery task", await measure_discovery_task(frame))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
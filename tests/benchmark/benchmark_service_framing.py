@@ -0,0 +1,188 @@
+"""
+(c) 2022 Jaxcie
+This code is licensed under MIT license (see LICENSE for details)
+
+Benchmark of decoding bursts of frames received on the main connection of a StageLinQ device.
+
+A burst of service announcements is split into segments of random size, like TCP delivers them, and read through a
+fake stream reader that returns at most the requested number of bytes of the current segment. The receive path of
+StageLinQService (_receive_frames) runs for real, and is compared against a copy of the previous implementation,
+which read 1024 bytes at a time, joined leftovers with the new data and sliced the data again after every frame. The
+previous implementation is also run with the read size of the receive buffer, where slicing after every frame copies
+the rest of every read once per frame.
+
+Run from the repository root:
+    PYTHONPATH=. python tests/benchmark/benchmark_service_framing.py
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+from PyStageLinQ.DataClasses import (
+    StageLinQDiscoveryData,
+    StageLinQServiceAnnouncementData,
+)
+from PyStageLinQ.ErrorCodes import PyStageLinQError
+from PyStageLinQ.MessageClasses import (
+    ConnectionTypes,
+    StageLinQDiscovery,
+    StageLinQReference,
+    StageLinQRequestServices,
+    StageLinQServiceAnnouncement,
+)
+from PyStageLinQ.Network import StageLinQService
+from PyStageLinQ.Token import StageLinQToken
+
+BURST_SIZES = [100, 1000, 10000]
+MAX_SEGMENT_SIZE = 16384
+SAMPLES = 5
+
+
+class SegmentReader:
+    def __init__(self, segments):
+        self.segments = list(segments)
+
+    async def read(self, n):
+        segment = self.segments[0]
+        if len(segment) <= n:
+            self.segments.pop(0)
+            return segment
+        self.segments[0] = segment[n:]
+        return segment[:n]
+
+
+def make_token():
+    token = StageLinQToken()
+    token.generate_token()
+    return token
+
+
+def make_burst(n_frames):
+    token = make_token()
+    return b"".join(
+        StageLinQServiceAnnouncement().encode_frame(
+            StageLinQServiceAnnouncementData(
+                Token=token, Service=f"Service{i}", Port=i % 65536
+            )
+        )
+        for i in range(n_frames)
+    )
+
+
+def make_segments(burst):
+    segments = []
+    start = 0
+    while start < len(burst):
+        stop = start + random.randint(1, MAX_SEGMENT_SIZE)
+        segments.append(burst[start:stop])
+        start = stop
+    return segments
+
+
+def make_service():
+    discovery_frame = StageLinQDiscovery()
+    discovery_frame.decode_frame(
+        StageLinQDiscovery().encode_frame(
+            StageLinQDiscoveryData(
+                Token=make_token(),
+                DeviceName="Benchmark Device",
+                ConnectionType=ConnectionTypes.HOWDY,
+                SwName="JP11",
+                SwVersion="3.0.0",
+                ReqServicePort=50010,
+            )
+        )
+    )
+    service = StageLinQService("127.0.0.1", discovery_frame, make_token(), None)
+    # Only the receive path is measured, there is no connection to open
+    service.receive_task.cancel()
+    return service
+
+
+def previous_decode_multiframe(frame):
+    subframes = []
+    while len(frame) >= 4:
+        match (int.from_bytes(frame[0:4], byteorder="big")):
+            case 0:
+                data = StageLinQServiceAnnouncement()
+            case 1:
+                data = StageLinQReference()
+            case 2:
+                data = StageLinQRequestServices()
+            case _:
+                return None
+        decode_status = data.decode_frame(frame)
+
+        if decode_status != PyStageLinQError.STAGELINQOK:
+            if decode_status == PyStageLinQError.INVALIDLENGTH:
+                return subframes, frame
+            else:
+                return None
+
+        subframes.append(data.get())
+        frame = frame[data.get_len() :]
+
+    # The previous implementation dropped up to 3 bytes here, they are kept so it can decode fragmented bursts at all
+    return subframes, frame if len(frame) > 0 else None
+
+
+async def measure_previous(segments, n_frames, read_size) -> float:
+    reader = SegmentReader(segments)
+    remaining_data = None
+    decoded = 0
+    start = time.perf_counter()
+    while decoded < n_frames:
+        response = await reader.read(read_size)
+        if remaining_data is not None:
+            response = b"".join([remaining_data, response])
+        frames, remaining_data = previous_decode_multiframe(response)
+        decoded += len(frames)
+    return time.perf_counter() - start
+
+
+async def measure_receive_frames(segments, n_frames) -> float:
+    service = make_service()
+    service.reader = SegmentReader(segments)
+    decoded = 0
+    start = time.perf_counter()
+    while decoded < n_frames:
+        decoded += len(await service._receive_frames())
+    return time.perf_counter() - start
+
+
+def report(name, n_frames, durations):
+    per_frame_us = [duration * 1e6 / n_frames for duration in durations]
+    print(
+        f"{name:<23} {n_frames:>6} frames   median: {statistics.median(per_frame_us):>8.2f} us/frame   "
+        f"total: {statistics.median(durations) * 1e3:>9.2f} ms"
+    )
+
+
+async def main():
+    print(f"Decoding of fragmented service announcement bursts, median of {SAMPLES}:")
+    for n_frames in BURST_SIZES:
+        burst = make_burst(n_frames)
+        segment_sets = [make_segments(burst) for _ in range(SAMPLES)]
+        for read_size in [1024, StageLinQService.RECEIVESIZE]:
+            report(
+                f"{read_size} B reads + slicing",
+                n_frames,
+                [
+                    await measure_previous(segments, n_frames, read_size)
+                    for segments in segment_sets
+                ],
+            )
+        report(
+            "receive buffer",
+            n_frames,
+            [
+                await measure_receive_frames(segments, n_frames)
+                for segments in segment_sets
+            ],
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+(c) 2022 Jaxcie
+This code is licensed under MIT license (see LICENSE for details)
+
+Benchmark of the time from PyStageLinQ being created until the first StageLinQ device is connected, i.e. until
+new_device_found_callback is called with the services of the device. A FakeDevice on loopback announces itself every
+500 ms, just like a real device, and is already running when PyStageLinQ is started.
+
+The default start, which waits for three announcements to be sent before it starts listening, is compared against
+fast_start, which listens right away and only holds back the service request.
+
+Port 51337 on 127.0.0.1 must be free. Run from the repository root:
+    PYTHONPATH=. python tests/benchmark/benchmark_startup.py
+"""
+
+import asyncio
+import statistics
+import time
+
+from PyStageLinQ.PyStageLinQ import PyStageLinQ
+from fake_device import FakeDevice, HOST
+
+SAMPLES = 5
+
+
+async def measure_startup(fast_start: bool) -> float:
+    device = FakeDevice()
+    await device.start()
+    # Let the device announce itself at a random point relative to the start of PyStageLinQ
+    await asyncio.sleep(0.25)
+
+    connected = asyncio.Event()
+
+    def new_device_found(ip, discovery_frame, service_list):
+        connected.set()
+
+    start = time.perf_counter()
+    pystagelinq = PyStageLinQ(
+        new_device_found, name="Benchmark", ip=HOST, fast_start=fast_start
+    )
+    start_task = asyncio.create_task(pystagelinq._start_stagelinq())
+    await asyncio.wait_for(connected.wait(), timeout=10)
+    startup_time = time.perf_counter() - start
+
+    start_task.cancel()
+    pystagelinq._stop_all_tasks()
+    pystagelinq._stop()
+    await device.stop()
+    # Give cancelled tasks time to close their sockets before the next sample binds them again
+    await asyncio.sleep(0.1)
+    return startup_time
+
+
+def report(name, startup_times):
+    startup_times_ms = [startup_time * 1e3 for startup_time in startup_times]
+    print(
+        f"{name:<12} median: {statistics.median(startup_times_ms):>8.1f} ms   "
+        f"min: {min(startup_times_ms):>8.1f} ms   max: {max(startup_times_ms):>8.1f} ms"
+    )
+
+
+def main():
+    print(f"Time from start to first connected device over {SAMPLES} starts:")
+    for name, fast_start in [("default", False), ("fast_start", True)]:
+        startup_times = [
+            asyncio.run(measure_startup(fast_start)) for _ in range(SAMPLES)
+        ]
+        report(name, startup_times)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+(c) 2022 Jaxcie
+This code is licensed under MIT license (see LICENSE for details)
+
+A minimal StageLinQ device on loopback that the benchmarks can connect PyStageLinQ to. It announces itself with
+discovery frames sent to 127.0.0.1 and answers service requests on its main port with its list of services.
+
+This is only enough of the protocol to let PyStageLinQ find the device and request its services, it is not a
+reference implementation of a StageLinQ device. Nothing listens on the ports of the announced services.
+"""
+
+import asyncio
+import socket
+
+from PyStageLinQ.DataClasses import (
+    StageLinQDiscoveryData,
+    StageLinQServiceAnnouncementData,
+)
+from PyStageLinQ.MessageClasses import (
+    ConnectionTypes,
+    StageLinQDiscovery,
+    StageLinQServiceAnnouncement,
+)
+from PyStageLinQ.Token import StageLinQToken
+
+HOST = "127.0.0.1"
+DISCOVERY_PORT = 51337
+
+SERVICE_REQUEST_ID = (2).to_bytes(4, byteorder="big")
+
+
+class FakeDevice:
+    """
+    :param name: Device name used in the discovery frames.
+    :param services: Services announced when PyStageLinQ requests them, as service name to port.
+    :param announce_interval: Time in seconds between discovery frames.
+    :param discovery_port: Port on 127.0.0.1 the discovery frames are sent to.
+    """
+
+    def __init__(
+        self,
+        name: str = "Fake Device",
+        services: dict = None,
+        announce_interval: float = 0.5,
+        discovery_port: int = DISCOVERY_PORT,
+    ):
+        self.name = name
+        self.services = services or {"StateMap": 51338}
+        self.announce_interval = announce_interval
+        self.discovery_port = discovery_port
+
+        self.token = StageLinQToken()
+        self.token.generate_token()
+
+        self.main_server = None
+        self.service_requests = 0
+        self._connections = set()
+        self._announce_task = None
+        self._discovery_socket = None
+
+    @property
+    def main_port(self) -> int:
+        return self.main_server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        self.main_server = await asyncio.start_server(self._handle_main, HOST, 0)
+
+        self._discovery_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._announce_task = asyncio.create_task(self._announce())
+
+    async def stop(self) -> None:
+        self._announce_task.cancel()
+        self._discovery_socket.sendto(
+            self.discovery_frame(ConnectionTypes.EXIT), (HOST, self.discovery_port)
+        )
+        self._discovery_socket.close()
+        self.main_server.close()
+        # Lets the connection handlers return before the event loop is closed
+        for writer in self._connections:
+            writer.close()
+
+    def discovery_frame(self, connection_type: str = ConnectionTypes.HOWDY) -> bytes:
+        return StageLinQDiscovery().encode_frame(
+            StageLinQDiscoveryData(
+                Token=self.token,
+                DeviceName=self.name,
+                ConnectionType=connection_type,
+                SwName="JP11",
+                SwVersion="3.0.0",
+                ReqServicePort=self.main_port,
+            )
+        )
+
+    async def _announce(self) -> None:
+        frame = self.discovery_frame()
+        while True:
+            self._discovery_socket.sendto(frame, (HOST, self.discovery_port))
+            await asyncio.sleep(self.announce_interval)
+
+    async def _handle_main(self, reader, writer) -> None:
+        service_announcements = b"".join(
+            StageLinQServiceAnnouncement().encode_frame(
+                StageLinQServiceAnnouncementData(
+                    Token=self.token, Service=service, Port=port
+                )
+            )
+            for service, port in self.services.items()
+        )
+        self._connections.add(writer)
+        try:
+            while data := await reader.read(1024):
+                # Anything that is not a service request is a reference frame, which is ignored
+                if data[0:4] == SERVICE_REQUEST_ID:
+                    self.service_requests += 1
+                    writer.write(service_announcements)
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
@@ -0,0 +1,72 @@
+import pytest
+import PyStageLinQ.Cache
+
+
+@pytest.fixture()
+def dummy_cache():
+    return PyStageLinQ.Cache.LRUCache(2)
+
+
+def test_init_values(dummy_cache):
+    assert dummy_cache.maxsize == 2
+    assert dummy_cache.hits == 0
+    assert dummy_cache.misses == 0
+    assert len(dummy_cache) == 0
+
+
+def test_init_invalid_size():
+    with pytest.raises(ValueError) as exception:
+        PyStageLinQ.Cache.LRUCache(0)
+
+    assert exception.value.args[0] == "maxsize must be at least 1"
+
+
+def test_get_miss(dummy_cache):
+    assert dummy_cache.get(b"AAAA") is None
+    assert dummy_cache.get(b"AAAA", 5) == 5
+
+    assert dummy_cache.hits == 0
+    assert dummy_cache.misses == 2
+
+
+def test_put_and_get(dummy_cache):
+    dummy_cache.put(b"AAAA", 1)
+
+    assert b"AAAA" in dummy_cache
+    assert dummy_cache.get(b"AAAA") == 1
+    assert dummy_cache.hits == 1
+    assert dummy_cache.misses == 0
+
+
+def test_put_replaces_value(dummy_cache):
+    dummy_cache.put(b"AAAA", 1)
+    dummy_cache.put(b"AAAA", 2)
+
+    assert len(dummy_cache) == 1
+    assert dummy_cache.get(b"AAAA") == 2
+
+
+def test_evict_least_recently_used(dummy_cache):
+    dummy_cache.put(b"AAAA", 1)
+    dummy_cache.put(b"BBBB", 2)
+
+    # Use AAAA so BBBB becomes least recently used
+    dummy_cache.get(b"AAAA")
+    dummy_cache.put(b"CCCC", 3)
+
+    assert len(dummy_cache) == 2
+    assert b"AAAA" in dummy_cache
+    assert b"BBBB" not in dummy_cache
+    assert b"CCCC" in dummy_cache
+
+
+def test_clear(dummy_cache):
+    dummy_cache.put(b"AAAA", 1)
+    dummy_cache.get(b"AAAA")
+
+    dummy_cache.clear()
+
+    assert len(dummy_cache) == 0
+    assert b"AAAA" not in dummy_cache
+    # Statistics are kept
+    assert dummy_cache.hits == 1
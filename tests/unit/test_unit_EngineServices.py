@@ -46,6 +46,22 @@ def test_get_task(dummy_engine_services):
     assert dummy_engine_services.get_task() == state_map_task
 
 
+def test_stop(dummy_engine_services):
+    dummy_engine_services.state_map_task = Mock()
+    dummy_engine_services.writer = Mock()
+
+    dummy_engine_services.stop()
+
+    dummy_engine_services.state_map_task.cancel.assert_called_once_with()
+    dummy_engine_services.writer.close.assert_called_once_with()
+
+
+def test_stop_not_started(dummy_engine_services):
+    dummy_engine_services.stop()
+
+    assert dummy_engine_services.state_map_task is None
+
+
 @pytest.mark.asyncio
 async def test_read_state_map_nothing_read(dummy_engine_services):
     read_mock = AsyncMock()
@@ -54,6 +54,7 @@ def test_init_values(
     assert dummy_stagelinq_service.device_name == discovery_dummy.device_name
     assert dummy_stagelinq_service.device_token == discovery_dummy.token
     assert dummy_stagelinq_service.sw_name == discovery_dummy.sw_name
+    assert dummy_stagelinq_service.interface is None
 
     dummy_stagelinq_service.receive_task.assert_not_called()
 
@@ -112,6 +113,7 @@ async def test_get_tasks(dummy_stagelinq_service, monkeypatch):
     monkeypatch.setattr(PyStageLinQ.Network.asyncio, "sleep", sleep_mock)
 
     dummy_stagelinq_service.reference_task = Mock()
+    dummy_stagelinq_service.receive_task.done.return_value = False
 
     test_output = await dummy_stagelinq_service.get_tasks()
 
@@ -123,6 +125,23 @@ async def test_get_tasks(dummy_stagelinq_service, monkeypatch):
     assert sleep_mock.mock_calls[1].args[0] == 0.1
 
 
+@pytest.mark.asyncio
+async def test_get_tasks_connection_failed(dummy_stagelinq_service, monkeypatch):
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.Network.asyncio, "sleep", sleep_mock)
+
+    connection_error = ConnectionRefusedError()
+    dummy_stagelinq_service.receive_task.done.return_value = True
+    dummy_stagelinq_service.receive_task.cancelled.return_value = False
+    dummy_stagelinq_service.receive_task.exception.return_value = connection_error
+
+    with pytest.raises(RuntimeError) as exception:
+        await dummy_stagelinq_service.get_tasks()
+
+    assert exception.value.__cause__ is connection_error
+    sleep_mock.assert_not_called()
+
+
 def test_get_services_available(dummy_stagelinq_service):
     assert dummy_stagelinq_service.get_services_available() is False
 
@@ -290,13 +309,17 @@ async def test_receive_frames_no_frames(dummy_stagelinq_service, monkeypatch):
     reader_dummy = reader()
     dummy_stagelinq_service.reader = reader_dummy
 
-    decode_multiframe_mock = Mock(side_effect=[[None, None]])
+    decode_multiframe_mock = Mock(side_effect=[None])
     monkeypatch.setattr(
         dummy_stagelinq_service, "decode_multiframe", decode_multiframe_mock
     )
 
     assert await dummy_stagelinq_service._receive_frames() is False
-    decode_multiframe_mock.assert_called_once_with(response_data)
+    decode_multiframe_mock.assert_called_once_with(
+        dummy_stagelinq_service.receive_buffer
+    )
+    # Data that could not be decoded is thrown away
+    assert dummy_stagelinq_service.receive_buffer == bytearray()
 
 
 @pytest.mark.asyncio
@@ -310,7 +333,7 @@ async def test_receive_frames_valid_data(dummy_stagelinq_service, monkeypatch):
     reader_dummy = reader()
     dummy_stagelinq_service.reader = reader_dummy
 
-    decode_multiframe_mock = Mock(side_effect=[[frames_data, None]])
+    decode_multiframe_mock = Mock(side_effect=[[frames_data, len(response_data)]])
     monkeypatch.setattr(
         dummy_stagelinq_service, "decode_multiframe", decode_multiframe_mock
     )
@@ -318,6 +341,7 @@ async def test_receive_frames_valid_data(dummy_stagelinq_service, monkeypatch):
     assert await dummy_stagelinq_service._receive_frames() == frames_data
 
     assert dummy_stagelinq_service.last_frame == response_data
+    assert dummy_stagelinq_service.receive_buffer == bytearray()
 
 
 @pytest.mark.asyncio
@@ -334,18 +358,74 @@ async def test_receive_frames_valid_data_multiframe(
     reader_dummy = reader()
     dummy_stagelinq_service.reader = reader_dummy
 
-    decode_multiframe_mock = Mock(side_effect=[[frames_data, None]])
-    monkeypatch.setattr(
-        dummy_stagelinq_service, "decode_multiframe", decode_multiframe_mock
-    )
+    decoded_data = []
+
+    def decode_multiframe(frame):
+        decoded_data.append(bytes(frame))
+        return frames_data, 6
 
-    dummy_stagelinq_service.remaining_data = remaining_data
+    monkeypatch.setattr(dummy_stagelinq_service, "decode_multiframe", decode_multiframe)
+
+    dummy_stagelinq_service.receive_buffer = bytearray(remaining_data)
 
     assert await dummy_stagelinq_service._receive_frames() == frames_data
 
-    assert dummy_stagelinq_service.last_frame == b"".join(
-        [remaining_data, response_data]
+    # Data from the previous read is decoded together with the new data, undecoded data is kept
+    assert decoded_data == [b"".join([remaining_data, response_data])]
+    assert dummy_stagelinq_service.receive_buffer == bytearray(b"AA")
+
+
+@pytest.mark.asyncio
+async def test_receive_frames_fragmented(dummy_stagelinq_service, token_dummy):
+    burst = b"".join(
+        PyStageLinQ.Network.StageLinQServiceAnnouncement().encode_frame(
+            PyStageLinQ.DataClasses.StageLinQServiceAnnouncementData(
+                Token=token_dummy, Service=service, Port=port
+            )
+        )
+        for service, port in [("StateMap", 1), ("BeatInfo", 2), ("FileTransfer", 3)]
+    )
+    # Split in the middle of the second frame
+    split = len(burst) // 2
+
+    class reader:
+        read = AsyncMock(side_effect=[burst[:split], burst[split:]])
+
+    dummy_stagelinq_service.reader = reader()
+
+    first_frames = await dummy_stagelinq_service._receive_frames()
+    assert [frame.Service for frame in first_frames] == ["StateMap"]
+    assert len(dummy_stagelinq_service.receive_buffer) > 0
+
+    second_frames = await dummy_stagelinq_service._receive_frames()
+    assert [(frame.Service, frame.Port) for frame in second_frames] == [
+        ("BeatInfo", 2),
+        ("FileTransfer", 3),
+    ]
+    assert dummy_stagelinq_service.receive_buffer == bytearray()
+
+
+@pytest.mark.asyncio
+async def test_receive_frames_split_in_frame_id(dummy_stagelinq_service, token_dummy):
+    reference = PyStageLinQ.Network.StageLinQReference.encode_frame(
+        PyStageLinQ.DataClasses.StageLinQReferenceData(
+            OwnToken=token_dummy, DeviceToken=token_dummy, Reference=0
+        )
     )
+    burst = reference + reference
+
+    class reader:
+        # Second read starts in the middle of the message id of the second frame
+        read = AsyncMock(
+            side_effect=[burst[: len(reference) + 2], burst[len(reference) + 2 :]]
+        )
+
+    dummy_stagelinq_service.reader = reader()
+
+    assert len(await dummy_stagelinq_service._receive_frames()) == 1
+    assert dummy_stagelinq_service.receive_buffer == bytearray(reference[:2])
+    assert len(await dummy_stagelinq_service._receive_frames()) == 1
+    assert dummy_stagelinq_service.receive_buffer == bytearray()
 
 
 @pytest.mark.asyncio
@@ -534,6 +614,24 @@ def test_set_device_token_announcement_data(dummy_stagelinq_service, monkeypatch
     set_device_token_mock.assert_called_once_with(token_value)
 
 
+def test_set_device_token_announcement_token(
+    dummy_stagelinq_service, monkeypatch, token_dummy
+):
+    set_device_token_mock = Mock()
+    monkeypatch.setattr(
+        dummy_stagelinq_service.DeviceToken, "set_token", set_device_token_mock
+    )
+
+    # Decoded service announcements carry a StageLinQToken instead of bytes
+    test_frame = PyStageLinQ.DataClasses.StageLinQServiceAnnouncementData(
+        token_dummy, "AAAA", 1337
+    )
+
+    dummy_stagelinq_service._set_device_token(test_frame)
+
+    set_device_token_mock.assert_called_once_with(token_dummy.get_token())
+
+
 def test_set_device_token_request_service(dummy_stagelinq_service, monkeypatch):
     set_device_token_mock = Mock()
     monkeypatch.setattr(
@@ -648,7 +746,7 @@ async def test_send_refence_message(dummy_stagelinq_service, monkeypatch, token_
 
 
 def test_decode_multiframe_no_frame(dummy_stagelinq_service):
-    assert dummy_stagelinq_service.decode_multiframe(bytes()) == ([], None)
+    assert dummy_stagelinq_service.decode_multiframe(bytes()) == ([], 0)
 
 
 def test_decode_multiframe_short_frame(dummy_stagelinq_service):
@@ -674,9 +772,9 @@ def test_decode_multiframe_service_announcement(dummy_stagelinq_service, monkeyp
         PyStageLinQ.Network, "StageLinQServiceAnnouncement", service_announcement_dummy
     )
 
-    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], None)
+    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], 10)
 
-    service_announcement_mock.decode_frame.assert_called_once_with(service)
+    service_announcement_mock.decode_frame.assert_called_once_with(service, 0)
     service_announcement_mock.get.assert_called_once()
     service_announcement_mock.get_len.assert_called_once()
 
@@ -699,9 +797,9 @@ def test_decode_multiframe_reference(dummy_stagelinq_service, monkeypatch):
         PyStageLinQ.Network, "StageLinQReference", service_announcement_dummy
     )
 
-    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], None)
+    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], 10)
 
-    service_announcement_mock.decode_frame.assert_called_once_with(service)
+    service_announcement_mock.decode_frame.assert_called_once_with(service, 0)
     service_announcement_mock.get.assert_called_once()
     service_announcement_mock.get_len.assert_called_once()
 
@@ -725,9 +823,9 @@ def test_decode_multiframe_request_service(dummy_stagelinq_service, monkeypatch)
         PyStageLinQ.Network, "StageLinQRequestServices", service_announcement_dummy
     )
 
-    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], None)
+    assert dummy_stagelinq_service.decode_multiframe(service) == ([frame_data], 10)
 
-    service_announcement_mock.decode_frame.assert_called_once_with(service)
+    service_announcement_mock.decode_frame.assert_called_once_with(service, 0)
     service_announcement_mock.get.assert_called_once()
     service_announcement_mock.get_len.assert_called_once()
 
@@ -800,8 +898,32 @@ def test_decode_multiframe_decoding_too_short(dummy_stagelinq_service, monkeypat
         PyStageLinQ.Network, "StageLinQRequestServices", service_announcement_dummy
     )
 
-    assert dummy_stagelinq_service.decode_multiframe(service) == ([], service)
+    assert dummy_stagelinq_service.decode_multiframe(service) == ([], 0)
 
     assert service_announcement_mock.decode_frame.call_count == 1
     assert service_announcement_mock.get.call_count == 0
     assert service_announcement_mock.get_len.call_count == 0
+
+
+def test_stop(dummy_stagelinq_service):
+    receive_task = Mock()
+    reference_task = Mock()
+    writer = Mock()
+    dummy_stagelinq_service.receive_task = receive_task
+    dummy_stagelinq_service.reference_task = reference_task
+    dummy_stagelinq_service.writer = writer
+
+    dummy_stagelinq_service.stop()
+
+    assert dummy_stagelinq_service.get_loop_condition() is False
+    receive_task.cancel.assert_called_once_with()
+    reference_task.cancel.assert_called_once_with()
+    writer.close.assert_called_once_with()
+
+
+def test_stop_not_started(dummy_stagelinq_service):
+    dummy_stagelinq_service.receive_task = None
+
+    dummy_stagelinq_service.stop()
+
+    assert dummy_stagelinq_service.get_loop_condition() is False
@@ -1,9 +1,11 @@
 import pytest
 import PyStageLinQ.PyStageLinQ
 from PyStageLinQ.ErrorCodes import *
-from unittest.mock import AsyncMock, Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock, call
 
+import asyncio
 import random
+import socket
 
 name = "unittest"
 
@@ -38,6 +40,22 @@ def dummy_pystagelinq(dummy_ip, monkeypatch, dummy_PyStageLinQ_network_interface
     return PyStageLinQ.PyStageLinQ.PyStageLinQ(None, name=name, ip=dummy_ip)
 
 
+def set_up_discovery_endpoint(dummy_pystagelinq, monkeypatch, frames):
+    transport_mock = MagicMock()
+
+    async def create_discovery_endpoint_dummy(_, frame_received_callback):
+        for frame in frames:
+            frame_received_callback(*frame)
+        return transport_mock
+
+    monkeypatch.setattr(
+        dummy_pystagelinq,
+        "_create_discovery_endpoint",
+        create_discovery_endpoint_dummy,
+    )
+    return transport_mock
+
+
 @pytest.fixture(autouse=True)
 def ensure_cleanup(dummy_socket):
     """Ensure that everything is cleaned up between tests."""
@@ -119,6 +137,8 @@ def test_internal_stop(dummy_pystagelinq, monkeypatch):
             )
         )
     )
+    network_interface_mock.close_discovery_sockets.assert_called_once_with()
+    assert dummy_pystagelinq.get_loop_condition() is False
 
 
 def test_announce_self(dummy_pystagelinq, monkeypatch):
@@ -134,6 +154,78 @@ def test_announce_self(dummy_pystagelinq, monkeypatch):
     )
 
 
+@pytest.mark.asyncio
+async def test_no_announcement_after_stop(dummy_pystagelinq, monkeypatch):
+    network_interface_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "network_interface", network_interface_mock)
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", AsyncMock())
+
+    dummy_pystagelinq._stop()
+    # An announcement tick that is still running after stop
+    await dummy_pystagelinq._periodic_announcement()
+
+    assert dummy_pystagelinq.get_loop_condition() is False
+    assert dummy_pystagelinq.discovery_info.ConnectionType == "DISCOVERER_HOWDY_"
+    # EXIT is the last frame sent
+    network_interface_mock.send_discovery_frame.assert_called_once_with(
+        dummy_pystagelinq._get_discovery_frame("DISCOVERER_EXIT_")
+    )
+
+
+def test_get_discovery_frame_cached(dummy_pystagelinq, monkeypatch):
+    encode_frame_mock = Mock(side_effect=[b"howdy", b"exit"])
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.StageLinQDiscovery, "encode_frame", encode_frame_mock
+    )
+
+    assert dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_") == b"howdy"
+    assert dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_") == b"howdy"
+    assert dummy_pystagelinq._get_discovery_frame("DISCOVERER_EXIT_") == b"exit"
+    assert dummy_pystagelinq._get_discovery_frame("DISCOVERER_EXIT_") == b"exit"
+
+    assert encode_frame_mock.call_count == 2
+    assert (
+        encode_frame_mock.call_args_list[0].args[0].ConnectionType
+        == "DISCOVERER_HOWDY_"
+    )
+    assert (
+        encode_frame_mock.call_args_list[1].args[0].ConnectionType == "DISCOVERER_EXIT_"
+    )
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("DeviceName", "new name"),
+        ("SwName", "new sw name"),
+        ("SwVersion", "1.2.3"),
+        ("ReqServicePort", 1337),
+    ],
+)
+def test_get_discovery_frame_rebuilt_on_change(dummy_pystagelinq, field, value):
+    old_frame = dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_")
+
+    setattr(dummy_pystagelinq.discovery_info, field, value)
+    new_frame = dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_")
+
+    assert new_frame != old_frame
+    assert new_frame == PyStageLinQ.PyStageLinQ.StageLinQDiscovery().encode_frame(
+        dummy_pystagelinq.discovery_info
+    )
+
+
+def test_get_discovery_frame_rebuilt_on_token_change(dummy_pystagelinq):
+    old_frame = dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_")
+
+    dummy_pystagelinq.OwnToken.set_token(dummy_pystagelinq.OwnToken.get_token() ^ 1)
+    new_frame = dummy_pystagelinq._get_discovery_frame("DISCOVERER_HOWDY_")
+
+    assert new_frame != old_frame
+    assert new_frame == PyStageLinQ.PyStageLinQ.StageLinQDiscovery().encode_frame(
+        dummy_pystagelinq.discovery_info
+    )
+
+
 @pytest.mark.asyncio
 async def test_discover_stagelinq_device_bind_error(
     dummy_pystagelinq, monkeypatch, dummy_ip, dummy_socket
@@ -161,6 +253,7 @@ async def test_discover_stagelinq_check_initialization(
     dummy_pystagelinq, monkeypatch, dummy_ip, dummy_socket
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
+    transport_mock = set_up_discovery_endpoint(dummy_pystagelinq, monkeypatch, [])
 
     get_loop_condition_mock = Mock(side_effect=[False])
     monkeypatch.setattr(
@@ -176,9 +269,10 @@ async def test_discover_stagelinq_check_initialization(
         dummy_socket.AF_INET, dummy_socket.SOCK_DGRAM
     )
     dummy_socket.socket.return_value.bind.assert_called_once_with(
-        ("", dummy_pystagelinq.StageLinQ_discovery_port)
+        (dummy_ip, dummy_pystagelinq.StageLinQ_discovery_port)
     )
     dummy_socket.socket.return_value.setblocking.assert_called_once_with(False)
+    transport_mock.close.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -186,16 +280,11 @@ async def test_discover_stagelinq_timeout(
     dummy_pystagelinq, monkeypatch, dummy_ip, dummy_socket
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
-
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
+    transport_mock = set_up_discovery_endpoint(dummy_pystagelinq, monkeypatch, [])
 
     time_mock = MagicMock()
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
 
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
     get_loop_condition_mock = Mock()
     monkeypatch.setattr(
         dummy_pystagelinq, "get_loop_condition", get_loop_condition_mock
@@ -203,54 +292,14 @@ async def test_discover_stagelinq_timeout(
 
     get_loop_condition_mock.side_effect = [True, False]
     time_mock.time.side_effect = [0, 11]
-    select_mock.select.side_effect = [[False]]
 
     assert (
         await dummy_pystagelinq._discover_stagelinq_device(dummy_ip)
         == PyStageLinQError.DISCOVERYTIMEOUT
     )
 
-    select_mock.select.assert_called_once_with(
-        [dummy_socket.socket.return_value], [], [], 0
-    )
     assert time_mock.time.call_count == 2
-
-
-@pytest.mark.asyncio
-async def test_discover_stagelinq_bad_frame(
-    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_socket
-):
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
-
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
-
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
-    decode_frame_mock = Mock()
-    monkeypatch.setattr(
-        PyStageLinQ.PyStageLinQ.StageLinQDiscovery, "decode_frame", decode_frame_mock
-    )
-
-    get_loop_condition_mock = Mock()
-    monkeypatch.setattr(
-        dummy_pystagelinq, "get_loop_condition", get_loop_condition_mock
-    )
-
-    get_loop_condition_mock.side_effect = [True, False]
-    select_mock.select.side_effect = [[True]]
-    dummy_socket.socket.return_value.recvfrom.side_effect = [
-        [None, [dummy_ip, dummy_port]]
-    ]
-    decode_frame_mock.side_effect = [PyStageLinQError.INVALIDFRAME]
-
-    assert await dummy_pystagelinq._discover_stagelinq_device(dummy_ip) is None
-
-    select_mock.select.assert_called_once_with(
-        [dummy_socket.socket.return_value], [], [], 0
-    )
-    decode_frame_mock.assert_called_once_with(None)
+    transport_mock.close.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -259,22 +308,17 @@ async def test_discover_stagelinq_bad_port(
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
-
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
     time_mock = MagicMock()
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
 
     class discovery_dummy:
-        decode_frame = Mock(side_effect=[PyStageLinQError.STAGELINQOK])
         device_name = "Not Python"
         get = Mock()
         Port = 0
 
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "StageLinQDiscovery", discovery_dummy)
+    set_up_discovery_endpoint(
+        dummy_pystagelinq, monkeypatch, [(discovery_dummy(), dummy_ip)]
+    )
 
     get_loop_condition_mock = Mock()
     monkeypatch.setattr(
@@ -282,13 +326,11 @@ async def test_discover_stagelinq_bad_port(
     )
 
     get_loop_condition_mock.side_effect = [True, False]
-    select_mock.select.side_effect = [[True]]
-    dummy_socket.socket.return_value.recvfrom.side_effect = [[None, [dummy_ip, 0]]]
     time_mock.time.side_effect = [0, 5, 11]
 
     assert await dummy_pystagelinq._discover_stagelinq_device(dummy_ip) is None
 
-    assert time_mock.time.call_count == 1
+    assert time_mock.time.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -297,22 +339,17 @@ async def test_discover_stagelinq_self_name(
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
-
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
     time_mock = MagicMock()
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
 
     class discovery_dummy:
-        decode_frame = Mock(side_effect=[PyStageLinQError.STAGELINQOK])
         get = Mock()
         Port = dummy_port
         device_name = name
 
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "StageLinQDiscovery", discovery_dummy)
+    set_up_discovery_endpoint(
+        dummy_pystagelinq, monkeypatch, [(discovery_dummy(), dummy_ip)]
+    )
 
     get_loop_condition_mock = Mock()
     monkeypatch.setattr(
@@ -320,13 +357,11 @@ async def test_discover_stagelinq_self_name(
     )
 
     get_loop_condition_mock.side_effect = [True, False]
-    select_mock.select.side_effect = [[True]]
-    dummy_socket.socket.return_value.recvfrom.side_effect = [[None, [dummy_ip, 0]]]
     time_mock.time.side_effect = [0, 5, 11]
 
     assert await dummy_pystagelinq._discover_stagelinq_device(dummy_ip) is None
 
-    assert time_mock.time.call_count == 1
+    assert time_mock.time.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -335,23 +370,19 @@ async def test_discover_stagelinq_device_registered(
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
-
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
     time_mock = MagicMock()
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
 
     class discovery_dummy:
-        decode_frame = Mock(side_effect=[PyStageLinQError.STAGELINQOK])
         get = Mock()
         Port = dummy_port
         device_name = "AAAA"
+        connection_type = "DISCOVERER_HOWDY_"
 
     stagelinq_discovery_mock = discovery_dummy()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "StageLinQDiscovery", discovery_dummy)
+    set_up_discovery_endpoint(
+        dummy_pystagelinq, monkeypatch, [(stagelinq_discovery_mock, dummy_ip)]
+    )
 
     get_loop_condition_mock = Mock()
     monkeypatch.setattr(
@@ -359,16 +390,15 @@ async def test_discover_stagelinq_device_registered(
     )
 
     get_loop_condition_mock.side_effect = [True, False]
-    select_mock.select.side_effect = [[True]]
-    dummy_socket.socket.return_value.recvfrom.side_effect = [[None, [dummy_ip, 0]]]
     time_mock.time.side_effect = [0, 5, 11]
 
     dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
     dummy_pystagelinq.device_list.find_registered_device.side_effect = [True]
 
     assert await dummy_pystagelinq._discover_stagelinq_device(dummy_ip) is None
 
-    assert time_mock.time.call_count == 2
+    assert time_mock.time.call_count == 3
     dummy_pystagelinq.device_list.find_registered_device.assert_called_once_with(
         stagelinq_discovery_mock.get()
     )
@@ -380,12 +410,6 @@ async def test_discover_stagelinq(
 ):
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
-    select_mock = MagicMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "select", select_mock)
-
-    sleep_mock = AsyncMock()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
-
     time_mock = MagicMock()
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
 
@@ -393,13 +417,15 @@ async def test_discover_stagelinq(
     monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
 
     class discovery_dummy:
-        decode_frame = Mock(side_effect=[PyStageLinQError.STAGELINQOK])
         get = Mock()
         Port = dummy_port
         device_name = "AAAA"
+        connection_type = "DISCOVERER_HOWDY_"
 
     stagelinq_discovery_mock = discovery_dummy()
-    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "StageLinQDiscovery", discovery_dummy)
+    set_up_discovery_endpoint(
+        dummy_pystagelinq, monkeypatch, [(stagelinq_discovery_mock, dummy_ip)]
+    )
 
     get_loop_condition_mock = Mock()
     monkeypatch.setattr(
@@ -407,17 +433,487 @@ async def test_discover_stagelinq(
     )
 
     get_loop_condition_mock.side_effect = [True, False]
-    select_mock.select.side_effect = [[True]]
-    dummy_socket.socket.return_value.recvfrom.side_effect = [[None, [dummy_ip, 0]]]
     time_mock.time.side_effect = [0, 5, 11]
 
     dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
     dummy_pystagelinq.device_list.find_registered_device.side_effect = [False]
 
     assert await dummy_pystagelinq._discover_stagelinq_device(dummy_ip) is None
+    # Registration runs in its own task
+    await asyncio.gather(*dummy_pystagelinq._registration_tasks.values())
 
     assert time_mock.time.call_count == 3
-    register_device_mock.assert_called_once()
+    register_device_mock.assert_called_once_with(
+        stagelinq_discovery_mock,
+        dummy_ip,
+        dummy_pystagelinq.network_interface.determine_interface_of_remote_ip.return_value,
+    )
+    assert ("AAAA", dummy_port) in dummy_pystagelinq.device_liveness
+
+
+def test_queue_discovery_frame(dummy_ip):
+    discovery_queue = asyncio.Queue(maxsize=1)
+
+    PyStageLinQ.PyStageLinQ.PyStageLinQ._queue_discovery_frame(
+        discovery_queue, "AAAA", dummy_ip
+    )
+
+    assert discovery_queue.get_nowait() == ("AAAA", dummy_ip)
+
+
+def test_queue_discovery_frame_queue_full(dummy_ip):
+    discovery_queue = asyncio.Queue(maxsize=1)
+
+    PyStageLinQ.PyStageLinQ.PyStageLinQ._queue_discovery_frame(
+        discovery_queue, "AAAA", dummy_ip
+    )
+    # Frame is dropped instead of growing the queue
+    PyStageLinQ.PyStageLinQ.PyStageLinQ._queue_discovery_frame(
+        discovery_queue, "BBBB", dummy_ip
+    )
+
+    assert discovery_queue.qsize() == 1
+    assert discovery_queue.get_nowait() == ("AAAA", dummy_ip)
+
+
+def make_discovery_frame_dummy(dummy_port, connection_type="DISCOVERER_HOWDY_"):
+    discovery_frame = MagicMock()
+    discovery_frame.device_name = "AAAA"
+    discovery_frame.Port = dummy_port
+    discovery_frame.connection_type = connection_type
+    return discovery_frame
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_known_device(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    time_mock = MagicMock()
+    time_mock.monotonic.return_value = 1
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
+
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    device = MagicMock()
+    device.device_token = discovery_frame.token
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = device
+
+    device_lost_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_device_lost", device_lost_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+
+    device_lost_mock.assert_not_called()
+    dummy_pystagelinq.device_list.find_registered_device.assert_not_called()
+    dummy_pystagelinq.device_list.get_device_by_name_port.assert_called_once_with(
+        "AAAA", dummy_port
+    )
+    # Known devices are handled without building the discovery data
+    discovery_frame.get.assert_not_called()
+    assert dummy_pystagelinq.device_liveness.next_deadline() == 1 + 5.0
+    assert dummy_pystagelinq._announced_devices[("AAAA", dummy_port)] == (
+        discovery_frame,
+        dummy_ip,
+        dummy_pystagelinq.network_interface.determine_interface_of_remote_ip.return_value,
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_exit(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port, "DISCOVERER_EXIT_")
+    dummy_pystagelinq.device_list = MagicMock()
+
+    device_lost_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_device_lost", device_lost_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+
+    device_lost_mock.assert_called_once_with(discovery_frame, dummy_ip)
+    dummy_pystagelinq.device_list.find_registered_device.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_exit_unknown_device(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port, "DISCOVERER_EXIT_")
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
+
+    device_lost_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_device_lost", device_lost_mock)
+    register_device_mock = AsyncMock()
+    monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+
+    device_lost_mock.assert_not_called()
+    register_device_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_new_token(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    time_mock = MagicMock()
+    time_mock.monotonic.return_value = 0
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
+
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.find_registered_device.return_value = False
+
+    device_lost_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_device_lost", device_lost_mock)
+    register_device_mock = AsyncMock()
+    monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+
+    await dummy_pystagelinq._registration_tasks[("AAAA", dummy_port)]
+
+    # Device restarted, so the old connection is dropped and the device registered again
+    device_lost_mock.assert_called_once_with(discovery_frame, dummy_ip)
+    register_device_mock.assert_awaited_once_with(
+        discovery_frame,
+        dummy_ip,
+        dummy_pystagelinq.network_interface.determine_interface_of_remote_ip.return_value,
+    )
+    assert dummy_pystagelinq._registration_tasks == {}
+    assert ("AAAA", dummy_port) in dummy_pystagelinq.device_liveness
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_register_failed(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
+    dummy_pystagelinq.device_list.find_registered_device.return_value = False
+
+    register_device_mock = AsyncMock(side_effect=ConnectionRefusedError)
+    monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+
+    await dummy_pystagelinq._registration_tasks[("AAAA", dummy_port)]
+
+    # Not marked as seen, so the next announcement tries to register it again
+    register_device_mock.assert_awaited_once()
+    assert dummy_pystagelinq._registration_tasks == {}
+    assert ("AAAA", dummy_port) not in dummy_pystagelinq.device_liveness
+    assert ("AAAA", dummy_port) not in dummy_pystagelinq._announced_devices
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_registration_in_flight(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
+    dummy_pystagelinq.device_list.find_registered_device.return_value = False
+
+    registration_done = asyncio.Event()
+
+    async def register_device(discovery_frame, ip, interface):
+        await registration_done.wait()
+
+    register_device_mock = AsyncMock(side_effect=register_device)
+    monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
+
+    await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+    registration_task = dummy_pystagelinq._registration_tasks[("AAAA", dummy_port)]
+    await asyncio.sleep(0)
+
+    # Announcements received while connecting do not start another registration
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is True
+    )
+    assert dummy_pystagelinq._registration_tasks == {
+        ("AAAA", dummy_port): registration_task
+    }
+
+    registration_done.set()
+    await registration_task
+
+    register_device_mock.assert_awaited_once()
+    assert ("AAAA", dummy_port) in dummy_pystagelinq.device_liveness
+
+
+@pytest.mark.asyncio
+async def test_handle_discovery_frame_unknown_interface(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq.network_interface.determine_interface_of_remote_ip.return_value = (
+        None
+    )
+    dummy_pystagelinq.device_list = MagicMock()
+
+    register_device_mock = AsyncMock()
+    monkeypatch.setattr(dummy_pystagelinq, "_register_new_device", register_device_mock)
+
+    assert (
+        await dummy_pystagelinq._handle_discovery_frame(discovery_frame, dummy_ip)
+        is False
+    )
+
+    dummy_pystagelinq.network_interface.determine_interface_of_remote_ip.assert_called_once_with(
+        dummy_ip
+    )
+    dummy_pystagelinq.device_list.get_device_by_name_port.assert_not_called()
+    register_device_mock.assert_not_called()
+
+
+def test_device_lost(dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port):
+    device_lost_callback = Mock()
+    dummy_pystagelinq.device_lost_callback = device_lost_callback
+
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    device = MagicMock()
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = device
+
+    stop_device_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_stop_device", stop_device_mock)
+
+    dummy_pystagelinq._device_seen(discovery_frame, dummy_ip, Mock())
+    dummy_pystagelinq._device_lost(discovery_frame, dummy_ip)
+
+    assert dummy_pystagelinq._announced_devices == {}
+    assert len(dummy_pystagelinq.device_liveness) == 0
+    dummy_pystagelinq.device_list.unregister_device.assert_called_once_with(device)
+    stop_device_mock.assert_called_once_with(device)
+    device_lost_callback.assert_called_once_with(dummy_ip, discovery_frame)
+
+
+def test_device_lost_not_registered(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq.device_list = MagicMock()
+    dummy_pystagelinq.device_list.get_device_by_name_port.return_value = None
+
+    stop_device_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_stop_device", stop_device_mock)
+
+    dummy_pystagelinq._device_lost(discovery_frame, dummy_ip)
+
+    dummy_pystagelinq.device_list.unregister_device.assert_not_called()
+    stop_device_mock.assert_not_called()
+
+
+def test_stop_device(dummy_pystagelinq, dummy_ip):
+    device = MagicMock()
+    device.Ip = dummy_ip
+    device.device_name = "AAAA"
+
+    state_map = MagicMock()
+    state_map.service_handle = PyStageLinQ.PyStageLinQ.EngineServices.ServiceHandle(
+        device="AAAA", ip=dummy_ip, service="StateMap", port=1
+    )
+    other_state_map = MagicMock()
+    other_state_map.service_handle = (
+        PyStageLinQ.PyStageLinQ.EngineServices.ServiceHandle(
+            device="BBBB", ip=dummy_ip, service="StateMap", port=1
+        )
+    )
+    dummy_pystagelinq.active_services = [state_map, other_state_map]
+    dummy_pystagelinq.tasks = {
+        device.receive_task,
+        device.reference_task,
+        state_map.get_task(),
+        other_state_map.get_task(),
+    }
+
+    dummy_pystagelinq._stop_device(device)
+
+    device.stop.assert_called_once_with()
+    state_map.stop.assert_called_once_with()
+    other_state_map.stop.assert_not_called()
+    assert dummy_pystagelinq.active_services == [other_state_map]
+    assert dummy_pystagelinq.tasks == {other_state_map.get_task()}
+
+
+@pytest.mark.asyncio
+async def test_device_liveness_monitor(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    time_mock = MagicMock()
+    time_mock.monotonic.side_effect = [0, 1, 6]
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "time", time_mock)
+
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
+
+    get_loop_condition_mock = Mock(side_effect=[True, False])
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", get_loop_condition_mock
+    )
+
+    device_lost_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_device_lost", device_lost_mock)
+
+    discovery_frame = make_discovery_frame_dummy(dummy_port)
+    dummy_pystagelinq._device_seen(discovery_frame, dummy_ip, Mock())
+
+    await dummy_pystagelinq._device_liveness_monitor()
+
+    sleep_mock.assert_awaited_once_with(4)
+    device_lost_mock.assert_called_once_with(discovery_frame, dummy_ip)
+
+
+@pytest.mark.asyncio
+async def test_device_liveness_monitor_no_devices(dummy_pystagelinq, monkeypatch):
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
+
+    get_loop_condition_mock = Mock(side_effect=[True, False])
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", get_loop_condition_mock
+    )
+
+    await dummy_pystagelinq._device_liveness_monitor()
+
+    sleep_mock.assert_awaited_once_with(dummy_pystagelinq.device_liveness.timeout)
+
+
+@pytest.mark.asyncio
+async def test_create_discovery_endpoint(dummy_pystagelinq):
+    frame_received_mock = Mock()
+    discover_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    discover_socket.bind(("127.0.0.1", 0))
+
+    transport = await dummy_pystagelinq._create_discovery_endpoint(
+        discover_socket, frame_received_mock
+    )
+
+    assert type(transport.get_protocol()) is (
+        PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol
+    )
+    assert transport.get_protocol().frame_received_callback is frame_received_mock
+
+    transport.close()
+
+
+def test_discovery_protocol_connection_made():
+    transport_mock = Mock()
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(Mock())
+
+    assert protocol.transport is None
+
+    protocol.connection_made(transport_mock)
+
+    assert protocol.transport is transport_mock
+
+
+def test_discovery_protocol_bad_frame(monkeypatch, dummy_ip, dummy_port):
+    decode_frame_mock = Mock(side_effect=[PyStageLinQError.INVALIDFRAME])
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.StageLinQDiscovery, "decode_frame", decode_frame_mock
+    )
+    frame_received_mock = Mock()
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(
+        frame_received_mock
+    )
+
+    protocol.datagram_received(b"AAAA", (dummy_ip, dummy_port))
+
+    decode_frame_mock.assert_called_once_with(b"AAAA")
+    frame_received_mock.assert_not_called()
+
+
+def test_discovery_protocol_valid_frame(dummy_pystagelinq, dummy_ip, dummy_port):
+    frame_received_mock = Mock()
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(
+        frame_received_mock
+    )
+
+    protocol.datagram_received(
+        PyStageLinQ.PyStageLinQ.StageLinQDiscovery().encode_frame(
+            dummy_pystagelinq.discovery_info
+        ),
+        (dummy_ip, dummy_port),
+    )
+
+    frame_received_mock.assert_called_once()
+    discovery_frame, ip = frame_received_mock.call_args.args
+    assert discovery_frame.device_name == name
+    assert discovery_frame.token.get_token() == dummy_pystagelinq.OwnToken.get_token()
+    assert ip == dummy_ip
+
+
+def test_discovery_protocol_repeated_frame(
+    dummy_pystagelinq, monkeypatch, dummy_ip, dummy_port
+):
+    frame_received_mock = Mock()
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(
+        frame_received_mock
+    )
+    frame = PyStageLinQ.PyStageLinQ.StageLinQDiscovery().encode_frame(
+        dummy_pystagelinq.discovery_info
+    )
+
+    protocol.datagram_received(frame, (dummy_ip, dummy_port))
+
+    decode_frame_mock = Mock()
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.StageLinQDiscovery, "decode_frame", decode_frame_mock
+    )
+
+    protocol.datagram_received(bytes(frame), (dummy_ip, dummy_port))
+
+    # Second frame is served from the cache without being decoded again
+    decode_frame_mock.assert_not_called()
+    assert frame_received_mock.call_count == 2
+    assert (
+        frame_received_mock.call_args_list[0].args[0]
+        is frame_received_mock.call_args_list[1].args[0]
+    )
+    assert protocol.frame_cache.hits == 1
+
+
+def test_discovery_protocol_bad_frame_not_cached(monkeypatch, dummy_ip, dummy_port):
+    decode_frame_mock = Mock(
+        side_effect=[PyStageLinQError.INVALIDFRAME, PyStageLinQError.INVALIDFRAME]
+    )
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.StageLinQDiscovery, "decode_frame", decode_frame_mock
+    )
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(Mock())
+
+    protocol.datagram_received(b"AAAA", (dummy_ip, dummy_port))
+    protocol.datagram_received(b"AAAA", (dummy_ip, dummy_port))
+
+    assert decode_frame_mock.call_count == 2
+    assert len(protocol.frame_cache) == 0
+
+
+def test_discovery_protocol_error_received():
+    protocol = PyStageLinQ.PyStageLinQ.PyStageLinQ_discovery_protocol(Mock())
+
+    assert protocol.error_received(OSError()) is None
 
 
 @pytest.mark.asyncio
@@ -441,12 +937,33 @@ async def test_register_new_device(dummy_pystagelinq, monkeypatch, dummy_ip):
         PyStageLinQ.PyStageLinQ, "StageLinQService", stagelinq_service_dummy
     )
 
+    dummy_pystagelinq._announcements_sent.set()
     await dummy_pystagelinq._register_new_device("BBBB", dummy_ip)
 
     service_mock.get_tasks.assert_called_once_with()
     service_mock.wait_for_services.assert_called_once_with(timeout=1)
 
 
+@pytest.mark.asyncio
+async def test_register_new_device_interface(dummy_pystagelinq, monkeypatch, dummy_ip):
+    stagelinq_service_mock = MagicMock()
+    stagelinq_service_mock.return_value.get_tasks = AsyncMock(return_value=[])
+    stagelinq_service_mock.return_value.wait_for_services = AsyncMock()
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ, "StageLinQService", stagelinq_service_mock
+    )
+    monkeypatch.setattr(dummy_pystagelinq, "device_list", MagicMock())
+    interface = Mock()
+
+    dummy_pystagelinq._announcements_sent.set()
+    await dummy_pystagelinq._register_new_device("BBBB", dummy_ip, interface)
+
+    assert stagelinq_service_mock.return_value.interface is interface
+    dummy_pystagelinq.device_list.register_device.assert_called_once_with(
+        stagelinq_service_mock.return_value
+    )
+
+
 @pytest.mark.asyncio
 async def test_register_new_task(dummy_pystagelinq, monkeypatch, dummy_ip):
     class stagelinq_service_dummy:
@@ -472,6 +989,7 @@ async def test_register_new_task(dummy_pystagelinq, monkeypatch, dummy_ip):
 
     service_mock.get_tasks.side_effect = [dummy_task]
 
+    dummy_pystagelinq._announcements_sent.set()
     await dummy_pystagelinq._register_new_device("BBBB", dummy_ip)
 
     service_mock.get_tasks.assert_called_once_with()
@@ -505,6 +1023,7 @@ async def test_register_callback(dummy_pystagelinq, monkeypatch, dummy_ip):
     callback_mock = Mock()
     dummy_pystagelinq.new_device_found_callback = callback_mock
 
+    dummy_pystagelinq._announcements_sent.set()
     await dummy_pystagelinq._register_new_device("BBBB", dummy_ip)
 
     service_mock.get_tasks.assert_called_once_with()
@@ -588,6 +1107,8 @@ async def test_subscripe_to_statemap(dummy_pystagelinq, monkeypatch):
     state_map_dummy.subscribe.assert_awaited_once_with(dummy_pystagelinq.OwnToken)
     state_map_dummy.get_task.assert_called_once_with()
     assert dummy_pystagelinq.tasks.pop() == state_map_dummy.get_task()
+    assert len(dummy_pystagelinq.active_services) == 1
+    assert type(dummy_pystagelinq.active_services[0]) is state_map_subscription_dummy
 
 
 @pytest.mark.asyncio
@@ -607,11 +1128,50 @@ async def test_start_stagelinq(dummy_pystagelinq, monkeypatch):
         dummy_pystagelinq, "_py_stagelinq_strapper", _py_stagelinq_strapper_mock
     )
 
+    _device_liveness_monitor_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_device_liveness_monitor", _device_liveness_monitor_mock
+    )
+
+    _interface_watcher_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_interface_watcher", _interface_watcher_mock
+    )
+
     await dummy_pystagelinq._start_stagelinq()
 
-    assert create_task_mock.call_count == 2
+    assert create_task_mock.call_count == 4
     create_task_mock.assert_any_call(_periodic_announcement_mock.return_value)
-    create_task_mock.assert_called_with(_py_stagelinq_strapper_mock.return_value)
+    create_task_mock.assert_any_call(_py_stagelinq_strapper_mock.return_value)
+    create_task_mock.assert_any_call(_device_liveness_monitor_mock.return_value)
+    create_task_mock.assert_called_with(_interface_watcher_mock.return_value)
+
+
+@pytest.mark.asyncio
+async def test_start_stagelinq_fast_start(dummy_pystagelinq, monkeypatch):
+    create_task_mock = Mock()
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.asyncio, "create_task", create_task_mock
+    )
+    for task_function in [
+        "_periodic_announcement",
+        "_py_stagelinq_strapper",
+        "_device_liveness_monitor",
+        "_interface_watcher",
+    ]:
+        monkeypatch.setattr(dummy_pystagelinq, task_function, Mock())
+
+    dummy_pystagelinq.fast_start = True
+    dummy_pystagelinq.network_interface.send_desc_on_all_if.return_value = False
+
+    await dummy_pystagelinq._start_stagelinq()
+
+    # Discovery is started before any announcement has been sent
+    dummy_pystagelinq.network_interface.send_desc_on_all_if.assert_not_called()
+    create_task_mock.assert_any_call(
+        dummy_pystagelinq._py_stagelinq_strapper.return_value
+    )
+    assert not dummy_pystagelinq._announcements_sent.is_set()
 
 
 @pytest.mark.asyncio
@@ -633,6 +1193,16 @@ async def test_start_stagelinq_disc_msg_not_sent(
         dummy_pystagelinq, "_py_stagelinq_strapper", _py_stagelinq_strapper_mock
     )
 
+    _device_liveness_monitor_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_device_liveness_monitor", _device_liveness_monitor_mock
+    )
+
+    _interface_watcher_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_interface_watcher", _interface_watcher_mock
+    )
+
     dummy_pystagelinq.network_interface.send_desc_on_all_if = MagicMock(
         side_effect=[False, False, True]
     )
@@ -659,14 +1229,26 @@ async def test_start_stagelinq_standalone(dummy_pystagelinq, monkeypatch):
         dummy_pystagelinq, "_py_stagelinq_strapper", _py_stagelinq_strapper_mock
     )
 
+    _device_liveness_monitor_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_device_liveness_monitor", _device_liveness_monitor_mock
+    )
+
+    _interface_watcher_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_interface_watcher", _interface_watcher_mock
+    )
+
     wait_for_exit_mock = AsyncMock()
     monkeypatch.setattr(dummy_pystagelinq, "_wait_for_exit", wait_for_exit_mock)
 
     await dummy_pystagelinq._start_stagelinq(standalone=True)
 
-    assert create_task_mock.call_count == 2
+    assert create_task_mock.call_count == 4
     create_task_mock.assert_any_call(_periodic_announcement_mock.return_value)
-    create_task_mock.assert_called_with(_py_stagelinq_strapper_mock.return_value)
+    create_task_mock.assert_any_call(_py_stagelinq_strapper_mock.return_value)
+    create_task_mock.assert_any_call(_device_liveness_monitor_mock.return_value)
+    create_task_mock.assert_called_with(_interface_watcher_mock.return_value)
     wait_for_exit_mock.assert_called_once_with()
 
 
@@ -805,6 +1387,28 @@ async def test_stop_all_tasks(dummy_pystagelinq, monkeypatch):
     task_mock.cancel.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_stop_all_tasks_discovery_tasks(dummy_pystagelinq):
+    discovery_task = MagicMock()
+    dummy_pystagelinq._discovery_tasks = {"": discovery_task}
+
+    dummy_pystagelinq._stop_all_tasks()
+
+    discovery_task.cancel.assert_called_once_with()
+    assert dummy_pystagelinq._discovery_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_stop_all_tasks_registration_tasks(dummy_pystagelinq, dummy_port):
+    registration_task = MagicMock()
+    dummy_pystagelinq._registration_tasks = {("AAAA", dummy_port): registration_task}
+
+    dummy_pystagelinq._stop_all_tasks()
+
+    registration_task.cancel.assert_called_once_with()
+    assert dummy_pystagelinq._registration_tasks == {}
+
+
 @pytest.mark.asyncio
 async def test_periodic_announcement(dummy_pystagelinq, monkeypatch):
     get_loop_condition_mock = Mock()
@@ -824,6 +1428,229 @@ async def test_periodic_announcement(dummy_pystagelinq, monkeypatch):
     assert get_loop_condition_mock.call_count == 2
     announce_self_mock.assert_called_once_with()
     sleep_mock.assert_called_once_with(0.5)
+    assert dummy_pystagelinq._announcements_sent.is_set()
+
+
+@pytest.mark.asyncio
+async def test_periodic_announcement_not_sent(dummy_pystagelinq, monkeypatch):
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", Mock(side_effect=[True, False])
+    )
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", AsyncMock())
+    monkeypatch.setattr(dummy_pystagelinq, "_announce_self", Mock())
+    dummy_pystagelinq.network_interface.send_desc_on_all_if.return_value = False
+
+    await dummy_pystagelinq._periodic_announcement()
+
+    assert not dummy_pystagelinq._announcements_sent.is_set()
+
+
+@pytest.mark.asyncio
+async def test_register_new_device_waits_for_announcements(
+    dummy_pystagelinq, monkeypatch, dummy_ip
+):
+    stagelinq_service_mock = MagicMock()
+    stagelinq_service_mock.return_value.get_tasks = AsyncMock(return_value=[])
+    stagelinq_service_mock.return_value.wait_for_services = AsyncMock()
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ, "StageLinQService", stagelinq_service_mock
+    )
+    monkeypatch.setattr(dummy_pystagelinq, "device_list", MagicMock())
+
+    register_task = asyncio.create_task(
+        dummy_pystagelinq._register_new_device("BBBB", dummy_ip)
+    )
+    await asyncio.sleep(0)
+
+    # No service request before our announcements have been sent
+    assert not register_task.done()
+    stagelinq_service_mock.assert_not_called()
+
+    dummy_pystagelinq._announcements_sent.set()
+    await register_task
+
+    stagelinq_service_mock.assert_called_once_with(
+        dummy_ip, "BBBB", dummy_pystagelinq.OwnToken, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_new_device_connection_failed(
+    dummy_pystagelinq, monkeypatch, dummy_ip
+):
+    dummy_pystagelinq._announcements_sent.set()
+    stagelinq_service_mock = MagicMock()
+    stagelinq_service_mock.return_value.get_tasks = AsyncMock(side_effect=RuntimeError)
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ, "StageLinQService", stagelinq_service_mock
+    )
+    monkeypatch.setattr(dummy_pystagelinq, "device_list", MagicMock())
+    stop_device_mock = Mock()
+    monkeypatch.setattr(dummy_pystagelinq, "_stop_device", stop_device_mock)
+    new_device_found_callback = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "new_device_found_callback", new_device_found_callback
+    )
+
+    with pytest.raises(RuntimeError):
+        await dummy_pystagelinq._register_new_device("BBBB", dummy_ip)
+
+    dummy_pystagelinq.device_list.unregister_device.assert_called_once_with(
+        stagelinq_service_mock.return_value
+    )
+    stop_device_mock.assert_called_once_with(stagelinq_service_mock.return_value)
+    new_device_found_callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_periodic_announcement_fast_start(dummy_pystagelinq, monkeypatch):
+    dummy_pystagelinq.fast_start = True
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", Mock(side_effect=[True, True, False])
+    )
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
+    monkeypatch.setattr(dummy_pystagelinq, "_announce_self", Mock())
+    dummy_pystagelinq.network_interface.send_desc_on_all_if.side_effect = [
+        False,
+        True,
+    ]
+
+    await dummy_pystagelinq._periodic_announcement()
+
+    # Back to back until the announcements have been sent, then the normal interval
+    assert sleep_mock.await_args_list == [
+        call(dummy_pystagelinq.FASTSTARTANNOUNCEMENTINTERVAL),
+        call(0.5),
+    ]
+
+
+def test_get_discovery_bind_ips_posix(dummy_pystagelinq, monkeypatch):
+    os_mock = MagicMock()
+    os_mock.name = "posix"
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "os", os_mock)
+    monkeypatch.setattr(
+        dummy_pystagelinq.network_interface,
+        "target_interfaces",
+        [
+            PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info(
+                "", 0, 0, "1.2.3.4", 0, "", 0
+            ),
+            PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info(
+                "", 1, 0, "5.6.7.8", 0, "", 0
+            ),
+        ],
+    )
+
+    # One shared socket for all interfaces
+    assert dummy_pystagelinq._get_discovery_bind_ips() == [""]
+
+
+def test_get_discovery_bind_ips_windows(dummy_pystagelinq, monkeypatch):
+    os_mock = MagicMock()
+    os_mock.name = "nt"
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "os", os_mock)
+    monkeypatch.setattr(
+        dummy_pystagelinq.network_interface,
+        "target_interfaces",
+        [
+            PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info(
+                "", 0, 0, "1.2.3.4", 0, "", 0
+            ),
+            PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info(
+                "", 1, 0, "5.6.7.8", 0, "", 0
+            ),
+        ],
+    )
+
+    assert dummy_pystagelinq._get_discovery_bind_ips() == ["1.2.3.4", "5.6.7.8"]
+
+
+def test_update_discovery_tasks(dummy_pystagelinq, monkeypatch):
+    create_task_mock = Mock()
+    monkeypatch.setattr(
+        PyStageLinQ.PyStageLinQ.asyncio, "create_task", create_task_mock
+    )
+    discover_device_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_discover_stagelinq_device", discover_device_mock
+    )
+    removed_task = Mock()
+    kept_task = Mock()
+    dummy_pystagelinq._discovery_tasks = {"1.2.3.4": removed_task, "5.6.7.8": kept_task}
+    monkeypatch.setattr(
+        dummy_pystagelinq,
+        "_get_discovery_bind_ips",
+        Mock(return_value=["5.6.7.8", "9.10.11.12"]),
+    )
+
+    dummy_pystagelinq._update_discovery_tasks()
+
+    removed_task.cancel.assert_called_once_with()
+    kept_task.cancel.assert_not_called()
+    discover_device_mock.assert_called_once_with("9.10.11.12", timeout=None)
+    create_task_mock.assert_called_once_with(discover_device_mock.return_value)
+    assert dummy_pystagelinq._discovery_tasks == {
+        "5.6.7.8": kept_task,
+        "9.10.11.12": create_task_mock.return_value,
+    }
+
+
+@pytest.mark.asyncio
+async def test_interface_watcher_no_change(dummy_pystagelinq, monkeypatch):
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", Mock(side_effect=[True, False])
+    )
+    update_discovery_tasks_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_update_discovery_tasks", update_discovery_tasks_mock
+    )
+    dummy_pystagelinq.network_interface.refresh_interfaces.return_value = ([], [])
+
+    await dummy_pystagelinq._interface_watcher()
+
+    sleep_mock.assert_awaited_once_with(dummy_pystagelinq.interface_poll_interval)
+    dummy_pystagelinq.network_interface.refresh_interfaces.assert_called_once_with()
+    update_discovery_tasks_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_interface_watcher_changed(dummy_pystagelinq, monkeypatch):
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", AsyncMock())
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", Mock(side_effect=[True, False])
+    )
+    update_discovery_tasks_mock = Mock()
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_update_discovery_tasks", update_discovery_tasks_mock
+    )
+    dummy_pystagelinq.network_interface.refresh_interfaces.return_value = (
+        [Mock()],
+        [],
+    )
+
+    await dummy_pystagelinq._interface_watcher()
+
+    update_discovery_tasks_mock.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_py_stagelinq_strapper_no_interfaces(dummy_pystagelinq, monkeypatch):
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ.asyncio, "sleep", sleep_mock)
+    monkeypatch.setattr(
+        dummy_pystagelinq, "get_loop_condition", Mock(side_effect=[True, True, False])
+    )
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_get_discovery_bind_ips", Mock(return_value=[])
+    )
+
+    await dummy_pystagelinq._py_stagelinq_strapper()
+
+    # Keeps waiting for interfaces to be added
+    assert sleep_mock.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -838,9 +1665,13 @@ async def test_py_stagelinq_strapper(dummy_pystagelinq, monkeypatch):
         [PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info("", 0, 0, "", 0, "", 0)],
     )
 
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_get_discovery_bind_ips", Mock(return_value=[""])
+    )
+
     await dummy_pystagelinq._py_stagelinq_strapper()
 
-    discover_device_mock.assert_called_once_with("", timeout=2)
+    discover_device_mock.assert_called_once_with("", timeout=None)
 
 
 @pytest.mark.asyncio
@@ -861,9 +1692,13 @@ async def test_py_stagelinq_strapper_loop_condition_false(
         [PyStageLinQ.PyStageLinQ.PyStageLinQ_interface_info("", 0, 0, "", 0, "", 0)],
     )
 
+    monkeypatch.setattr(
+        dummy_pystagelinq, "_get_discovery_bind_ips", Mock(return_value=[""])
+    )
+
     await dummy_pystagelinq._py_stagelinq_strapper()
 
-    discover_device_mock.assert_called_once_with("", timeout=2)
+    discover_device_mock.assert_called_once_with("", timeout=None)
 
 
 @pytest.mark.asyncio
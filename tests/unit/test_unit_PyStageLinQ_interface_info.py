@@ -9,8 +9,8 @@ import random
 
 
 class dummy_net_if_stats:
-    def __init__(self):
-        self.isup = True
+    def __init__(self, isup=True):
+        self.isup = isup
 
 
 class dummy_net_if_addrs:
@@ -96,9 +96,9 @@ def test_init_values_ip_none(monkeypatch, dummy_socket):
     dummy_ips["interface3"][0].family = None
 
     dummy_stats = {
-        "interface1": [None],
-        "interface2": [None],
-        "interface3": [None],
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
     }
 
     dummy_psutil.net_if_addrs.return_value = dummy_ips
@@ -160,9 +160,9 @@ def test_init_values_ip_single(monkeypatch, dummy_socket):
     dummy_ips["interface3"][0].family = None
 
     dummy_stats = {
-        "interface1": [None],
-        "interface2": [None],
-        "interface3": [None],
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
     }
 
     dummy_psutil.net_if_addrs.return_value = dummy_ips
@@ -210,10 +210,10 @@ def test_init_values_ip_multiple(monkeypatch, dummy_socket):
     dummy_ips["interface3"][0].family = None
 
     dummy_stats = {
-        "interface1": [None],
-        "interface2": [None],
-        "interface3": [None],
-        "interface4": [None],
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
+        "interface4": dummy_net_if_stats(),
     }
 
     dummy_psutil.net_if_addrs.return_value = dummy_ips
@@ -291,10 +291,10 @@ def test_init_values_ip_invalid(monkeypatch, dummy_socket):
     dummy_ips["interface3"][0].family = None
 
     dummy_stats = {
-        "interface1": [None],
-        "interface2": [None],
-        "interface3": [None],
-        "interface4": [None],
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
+        "interface4": dummy_net_if_stats(),
     }
 
     dummy_psutil.net_if_addrs.return_value = dummy_ips
@@ -326,12 +326,6 @@ def test_send_discovery_frame(
 ):
     dummy_discovery_frame = "AAAA"
 
-    discovery_socket = MagicMock()
-
-    dummy_socket.socket.side_effect = discovery_socket
-
-    dummy_socket.getaddrinfo.side_effect = [[["255.255.255.255"]]]
-
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
     dummy_PyStageLinQ_network_interface.send_discovery_frame(dummy_discovery_frame)
@@ -339,28 +333,43 @@ def test_send_discovery_frame(
     dummy_socket.socket.assert_called_once_with(
         dummy_socket.AF_INET, dummy_socket.SOCK_DGRAM
     )
-    discovery_socket.return_value.__enter__.return_value.setsockopt.assert_called_once_with(
+    discovery_socket = dummy_socket.socket.return_value
+    discovery_socket.setsockopt.assert_called_once_with(
         dummy_socket.SOL_SOCKET, dummy_socket.SO_BROADCAST, 1
     )
-    discovery_socket.return_value.__enter__.return_value.sendto.assert_called_once_with(
+    discovery_socket.bind.assert_called_once_with(
+        (dummy_PyStageLinQ_network_interface.target_interfaces[0].addr_str, 0)
+    )
+    discovery_socket.sendto.assert_called_once_with(
         dummy_discovery_frame,
         ("255.255.255.255", dummy_PyStageLinQ_network_interface.discovery_port),
     )
+    discovery_socket.close.assert_not_called()
+    assert dummy_PyStageLinQ_network_interface.target_interfaces[0].n_disc_msg_send == 1
 
 
-def test_send_discovery_frame_permission_error(
-    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_ip, dummy_socket
+def test_send_discovery_frame_socket_reused(
+    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_socket
 ):
     dummy_discovery_frame = "AAAA"
 
-    discovery_socket = MagicMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
+
+    dummy_PyStageLinQ_network_interface.send_discovery_frame(dummy_discovery_frame)
+    dummy_PyStageLinQ_network_interface.send_discovery_frame(dummy_discovery_frame)
+
+    dummy_socket.socket.assert_called_once()
+    dummy_socket.socket.return_value.bind.assert_called_once()
+    assert dummy_socket.socket.return_value.sendto.call_count == 2
+    assert dummy_PyStageLinQ_network_interface.target_interfaces[0].n_disc_msg_send == 2
 
-    dummy_socket.getaddrinfo.side_effect = [[["255.255.255.255"]]]
 
-    dummy_socket.socket.side_effect = discovery_socket
-    discovery_socket.return_value.__enter__.return_value.sendto.side_effect = (
-        PermissionError
-    )
+def test_send_discovery_frame_permission_error(
+    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_ip, dummy_socket
+):
+    dummy_discovery_frame = "AAAA"
+
+    dummy_socket.socket.return_value.sendto.side_effect = [PermissionError, None]
 
     monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
 
@@ -369,9 +378,48 @@ def test_send_discovery_frame_permission_error(
     dummy_socket.socket.assert_called_once_with(
         dummy_socket.AF_INET, dummy_socket.SOCK_DGRAM
     )
-    discovery_socket.return_value.__enter__.return_value.setsockopt.assert_called_once_with(
+    dummy_socket.socket.return_value.setsockopt.assert_called_once_with(
         dummy_socket.SOL_SOCKET, dummy_socket.SO_BROADCAST, 1
     )
+    dummy_socket.socket.return_value.close.assert_called_once_with()
+    assert dummy_PyStageLinQ_network_interface.discovery_sockets == {}
+    assert dummy_PyStageLinQ_network_interface.target_interfaces[0].n_disc_msg_send == 0
+
+    # Socket is rebuilt on the next discovery frame
+    dummy_PyStageLinQ_network_interface.send_discovery_frame(dummy_discovery_frame)
+
+    assert dummy_socket.socket.call_count == 2
+    assert dummy_PyStageLinQ_network_interface.target_interfaces[0].n_disc_msg_send == 1
+
+
+def test_send_discovery_frame_bind_error(
+    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_socket
+):
+    dummy_socket.socket.return_value.bind.side_effect = OSError
+
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
+
+    dummy_PyStageLinQ_network_interface.send_discovery_frame("AAAA")
+
+    dummy_socket.socket.return_value.close.assert_called_once_with()
+    dummy_socket.socket.return_value.sendto.assert_not_called()
+    assert dummy_PyStageLinQ_network_interface.discovery_sockets == {}
+
+
+def test_close_discovery_sockets(
+    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_socket
+):
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
+
+    dummy_PyStageLinQ_network_interface.send_discovery_frame("AAAA")
+    dummy_PyStageLinQ_network_interface.close_discovery_sockets()
+
+    dummy_socket.socket.return_value.close.assert_called_once_with()
+    assert dummy_PyStageLinQ_network_interface.discovery_sockets == {}
+
+    # Closing again is a no-op
+    dummy_PyStageLinQ_network_interface.close_discovery_sockets()
+    dummy_socket.socket.return_value.close.assert_called_once_with()
 
 
 def test_determine_interface_of_remote_ip(monkeypatch, dummy_socket):
@@ -386,10 +434,10 @@ def test_determine_interface_of_remote_ip(monkeypatch, dummy_socket):
     dummy_ips["interface3"][0].family = None
 
     dummy_stats = {
-        "interface1": [None],
-        "interface2": [None],
-        "interface3": [None],
-        "interface4": [None],
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
+        "interface4": dummy_net_if_stats(),
     }
 
     dummy_psutil.net_if_addrs.return_value = dummy_ips
@@ -488,3 +536,264 @@ def test_send_desc_on_all_if(dummy_PyStageLinQ_network_interface):
     dummy_PyStageLinQ_network_interface.target_interfaces[0].n_disc_msg_send = 10
 
     assert dummy_PyStageLinQ_network_interface.send_desc_on_all_if() is True
+
+
+def test_determine_interface_of_remote_ip_longest_prefix(monkeypatch):
+    dummy_psutil = MagicMock()
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="10.0.0.1", netmask="255.0.0.0")],
+        "interface2": [ifutils_net_if_addrs(ip="10.1.0.1", netmask="255.255.0.0")],
+        "interface3": [ifutils_net_if_addrs(ip="10.1.2.1", netmask="255.255.255.0")],
+    }
+    dummy_stats = {
+        "interface1": dummy_net_if_stats(),
+        "interface2": dummy_net_if_stats(),
+        "interface3": dummy_net_if_stats(),
+    }
+
+    dummy_psutil.net_if_addrs.return_value = dummy_ips
+    dummy_psutil.net_if_stats.return_value = dummy_stats
+
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "psutil", dummy_psutil)
+
+    dummy_pystagelinq_network_interface = (
+        PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+    )
+    target_interfaces = dummy_pystagelinq_network_interface.target_interfaces
+
+    assert (
+        dummy_pystagelinq_network_interface.determine_interface_of_remote_ip(
+            "10.1.2.200"
+        )
+        is target_interfaces[2]
+    )
+    assert (
+        dummy_pystagelinq_network_interface.determine_interface_of_remote_ip(
+            "10.1.3.200"
+        )
+        is target_interfaces[1]
+    )
+    assert (
+        dummy_pystagelinq_network_interface.determine_interface_of_remote_ip(
+            "10.2.3.200"
+        )
+        is target_interfaces[0]
+    )
+
+
+def test_determine_interface_of_remote_ip_cached(
+    dummy_PyStageLinQ_network_interface, monkeypatch, dummy_ip
+):
+    interface = dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(
+        dummy_ip
+    )
+    assert interface is dummy_PyStageLinQ_network_interface.target_interfaces[0]
+    assert (
+        dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(
+            "255.255.255.255"
+        )
+        is None
+    )
+
+    ipaddress_mock = MagicMock()
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "ipaddress", ipaddress_mock)
+
+    # Both hits and misses are served without parsing the IP again
+    assert (
+        dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(dummy_ip)
+        is interface
+    )
+    assert (
+        dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(
+            "255.255.255.255"
+        )
+        is None
+    )
+    ipaddress_mock.IPv4Address.assert_not_called()
+
+
+def test_build_interface_index_clears_cache(
+    dummy_PyStageLinQ_network_interface, dummy_ip
+):
+    dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(dummy_ip)
+
+    dummy_PyStageLinQ_network_interface.target_interfaces = []
+    dummy_PyStageLinQ_network_interface._build_interface_index()
+
+    assert (
+        dummy_PyStageLinQ_network_interface.determine_interface_of_remote_ip(dummy_ip)
+        is None
+    )
+
+
+def set_up_refresh_psutil(monkeypatch, dummy_ips):
+    dummy_psutil = MagicMock()
+    dummy_psutil.net_if_addrs.return_value = dummy_ips
+    dummy_psutil.net_if_stats.return_value = {
+        name: dummy_net_if_stats() for name in dummy_ips
+    }
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "psutil", dummy_psutil)
+    return dummy_psutil
+
+
+def test_enumerate_interfaces_reads_addrs_once(monkeypatch, dummy_socket):
+    dummy_psutil = set_up_refresh_psutil(
+        monkeypatch,
+        {
+            "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")],
+            "interface2": [ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")],
+        },
+    )
+
+    PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+
+    dummy_psutil.net_if_addrs.assert_called_once_with()
+    dummy_psutil.net_if_stats.assert_called_once_with()
+
+
+def test_refresh_interfaces_no_change(monkeypatch, dummy_socket):
+    set_up_refresh_psutil(
+        monkeypatch,
+        {"interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")]},
+    )
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+    interface = network_interface.target_interfaces[0]
+    interface.n_disc_msg_send = 3
+
+    assert network_interface.refresh_interfaces() == ([], [])
+
+    # Existing interface is kept with its counters
+    assert network_interface.target_interfaces == [interface]
+    assert network_interface.target_interfaces[0] is interface
+    assert interface.n_disc_msg_send == 3
+
+
+def test_refresh_interfaces_added(monkeypatch, dummy_socket):
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")]
+    }
+    dummy_psutil = set_up_refresh_psutil(monkeypatch, dummy_ips)
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+    interface = network_interface.target_interfaces[0]
+
+    assert network_interface.determine_interface_of_remote_ip("5.6.1.1") is None
+
+    dummy_ips["interface2"] = [
+        ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")
+    ]
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats()
+
+    added, removed = network_interface.refresh_interfaces()
+
+    assert removed == []
+    assert len(added) == 1
+    assert added[0].addr_str == "5.6.7.8"
+    assert added[0].id != interface.id
+    assert network_interface.target_interfaces == [interface, added[0]]
+    # Lookups see the new interface
+    assert network_interface.determine_interface_of_remote_ip("5.6.1.1") is added[0]
+
+
+def test_refresh_interfaces_removed(monkeypatch, dummy_socket):
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")],
+        "interface2": [ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")],
+    }
+    set_up_refresh_psutil(monkeypatch, dummy_ips)
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+    interface1, interface2 = network_interface.target_interfaces
+    dummy_socket.AF_INET = AF_INET
+    monkeypatch.setattr(PyStageLinQ.PyStageLinQ, "socket", dummy_socket)
+
+    network_interface.send_discovery_frame("AAAA")
+    assert network_interface.determine_interface_of_remote_ip("5.6.1.1") is interface2
+
+    del dummy_ips["interface2"]
+
+    assert network_interface.refresh_interfaces() == ([], [interface2])
+    assert network_interface.target_interfaces == [interface1]
+    assert interface2.id not in network_interface.discovery_sockets
+    assert interface1.id in network_interface.discovery_sockets
+    dummy_socket.socket.return_value.close.assert_called_once_with()
+    assert network_interface.determine_interface_of_remote_ip("5.6.1.1") is None
+
+
+def test_refresh_interfaces_requested_ip_only(monkeypatch, dummy_socket):
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")]
+    }
+    dummy_psutil = set_up_refresh_psutil(monkeypatch, dummy_ips)
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(
+        ip="1.2.3.4"
+    )
+
+    dummy_ips["interface2"] = [
+        ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")
+    ]
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats()
+
+    assert network_interface.refresh_interfaces() == ([], [])
+    assert len(network_interface.target_interfaces) == 1
+
+
+def test_enumerate_interfaces_skips_down_interfaces(monkeypatch, dummy_socket):
+    dummy_psutil = set_up_refresh_psutil(
+        monkeypatch,
+        {
+            "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")],
+            "interface2": [ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")],
+        },
+    )
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats(
+        isup=False
+    )
+
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+
+    assert [interface.name for interface in network_interface.target_interfaces] == [
+        "interface1"
+    ]
+
+
+def test_refresh_interfaces_interface_down(monkeypatch, dummy_socket):
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")],
+        "interface2": [ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")],
+    }
+    dummy_psutil = set_up_refresh_psutil(monkeypatch, dummy_ips)
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+    interface1, interface2 = network_interface.target_interfaces
+
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats(
+        isup=False
+    )
+    assert network_interface.refresh_interfaces() == ([], [interface2])
+
+    # Coming up again adds it as a new interface
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats()
+    added, removed = network_interface.refresh_interfaces()
+
+    assert removed == []
+    assert added[0].addr_str == "5.6.7.8"
+    assert network_interface.target_interfaces == [interface1, added[0]]
+
+
+def test_refresh_interfaces_ids_only_for_added(monkeypatch, dummy_socket):
+    dummy_ips = {
+        "interface1": [ifutils_net_if_addrs(ip="1.2.3.4", netmask="255.0.0.0")]
+    }
+    dummy_psutil = set_up_refresh_psutil(monkeypatch, dummy_ips)
+    network_interface = PyStageLinQ.PyStageLinQ.PyStageLinQ_network_interface(ip=None)
+
+    for _ in range(3):
+        network_interface.refresh_interfaces()
+
+    dummy_ips["interface2"] = [
+        ifutils_net_if_addrs(ip="5.6.7.8", netmask="255.255.0.0")
+    ]
+    dummy_psutil.net_if_stats.return_value["interface2"] = dummy_net_if_stats()
+    added, _ = network_interface.refresh_interfaces()
+
+    # Refreshes without changes do not use up ids
+    assert network_interface.target_interfaces[0].id == 0
+    assert added[0].id == 1
@@ -18,6 +18,9 @@ class StageLinQService_dummy:
     sw_name = ""
     Port = -1
 
+    def __init__(self):
+        self.device_token = PyStageLinQ.Token.StageLinQToken()
+
 
 @pytest.fixture()
 def dummy_device(discovery_dummy, monkeypatch):
@@ -111,7 +114,7 @@ def test_find_registered_device_bad_device_name(
 ):
     dummy_device.Port = port_dummy
 
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
 
     assert DeviceList.find_registered_device(discovery_data_dummy) is False
 
@@ -121,7 +124,7 @@ def test_find_registered_device_bad_port(
 ):
     dummy_device.device_name = discovery_data_dummy.DeviceName
 
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
 
     assert DeviceList.find_registered_device(discovery_data_dummy) is False
 
@@ -132,7 +135,7 @@ def test_find_registered_device_valid_input(
     dummy_device.device_name = discovery_data_dummy.DeviceName
     dummy_device.Port = discovery_data_dummy.ReqServicePort
 
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
 
     assert DeviceList.find_registered_device(discovery_data_dummy) is True
 
@@ -144,7 +147,7 @@ def test_find_main_interface_no_entries(DeviceList, discovery_data_dummy):
 def test_find_main_interface_bad_device_name(
     dummy_device, DeviceList, discovery_data_dummy
 ):
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
 
     assert DeviceList.find_main_interface(discovery_data_dummy) is False
 
@@ -155,7 +158,7 @@ def test_find_main_interface_bad_sw_name(
     dummy_device.device_name = discovery_data_dummy.DeviceName
     dummy_device.sw_name = "OfflineAnalyzer"
 
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
 
     assert DeviceList.find_main_interface(discovery_data_dummy) is False
 
@@ -165,6 +168,158 @@ def test_find_main_interface_valid_input(
 ):
     dummy_device.device_name = discovery_data_dummy.DeviceName
 
-    DeviceList.device_list.append(dummy_device)
+    DeviceList.register_device(dummy_device)
+
+    assert DeviceList.find_main_interface(discovery_data_dummy) is True
+
+
+def test_register_device_indexes(DeviceList, dummy_device, discovery_data_dummy):
+    dummy_device.device_name = discovery_data_dummy.DeviceName
+    dummy_device.Port = discovery_data_dummy.ReqServicePort
+    dummy_device.device_token.set_token(1234)
+
+    DeviceList.register_device(dummy_device)
+
+    assert DeviceList.get_device(discovery_data_dummy) is dummy_device
+    assert (
+        DeviceList.get_device_by_name_port(
+            discovery_data_dummy.DeviceName, discovery_data_dummy.ReqServicePort
+        )
+        is dummy_device
+    )
+    assert DeviceList.get_device_by_token(1234) is dummy_device
+    assert DeviceList.find_main_interface(discovery_data_dummy) is True
+
+
+def test_get_device_not_registered(DeviceList, discovery_data_dummy):
+    assert DeviceList.get_device(discovery_data_dummy) is None
+    assert DeviceList.get_device_by_name_port("AAAA", 1) is None
+    assert DeviceList.get_device_by_token(1234) is None
+
+
+def test_unregister_device_not_registered(DeviceList, dummy_device):
+    assert DeviceList.unregister_device(dummy_device) is False
+
+
+def test_unregister_device(DeviceList, dummy_device, discovery_data_dummy):
+    dummy_device.device_name = discovery_data_dummy.DeviceName
+    dummy_device.Port = discovery_data_dummy.ReqServicePort
+    dummy_device.device_token.set_token(1234)
+
+    DeviceList.register_device(dummy_device)
+
+    assert DeviceList.unregister_device(dummy_device) is True
+
+    assert DeviceList.device_list == []
+    assert DeviceList.find_registered_device(discovery_data_dummy) is False
+    assert DeviceList.find_main_interface(discovery_data_dummy) is False
+    assert DeviceList.get_device_by_token(1234) is None
+
+
+def test_unregister_device_keeps_other_devices(
+    DeviceList, dummy_device, dummy_device_2, discovery_data_dummy
+):
+    # Main interface and an OfflineAnalyzer instance of the same device
+    dummy_device.device_name = discovery_data_dummy.DeviceName
+    dummy_device.Port = discovery_data_dummy.ReqServicePort
+    dummy_device_2.device_name = discovery_data_dummy.DeviceName
+    dummy_device_2.sw_name = "OfflineAnalyzer"
+    dummy_device_2.Port = 1
+
+    DeviceList.register_device(dummy_device)
+    DeviceList.register_device(dummy_device_2)
+
+    DeviceList.unregister_device(dummy_device_2)
+
+    assert DeviceList.find_main_interface(discovery_data_dummy) is True
+    assert DeviceList.get_device(discovery_data_dummy) is dummy_device
+
+    DeviceList.unregister_device(dummy_device)
+
+    assert DeviceList.find_main_interface(discovery_data_dummy) is False
+
+
+def test_unregister_device_replaced_in_index(
+    DeviceList, dummy_device, dummy_device_2, discovery_data_dummy
+):
+    # Same name and port registered twice, e.g. after a reboot
+    for device in [dummy_device, dummy_device_2]:
+        device.device_name = discovery_data_dummy.DeviceName
+        device.Port = discovery_data_dummy.ReqServicePort
+
+    DeviceList.register_device(dummy_device)
+    DeviceList.register_device(dummy_device_2)
 
+    DeviceList.unregister_device(dummy_device)
+
+    assert DeviceList.get_device(discovery_data_dummy) is dummy_device_2
     assert DeviceList.find_main_interface(discovery_data_dummy) is True
+
+
+@pytest.fixture()
+def liveness_tracker():
+    return PyStageLinQ.Device.DeviceLivenessTracker(5)
+
+
+def test_liveness_tracker_init_values(liveness_tracker):
+    assert liveness_tracker.timeout == 5
+    assert len(liveness_tracker) == 0
+    assert liveness_tracker.next_deadline() is None
+    assert liveness_tracker.pop_lost(100) == []
+
+
+def test_liveness_tracker_seen(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+
+    assert "AAAA" in liveness_tracker
+    assert liveness_tracker.next_deadline() == 6
+
+
+def test_liveness_tracker_not_lost_before_deadline(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+
+    assert liveness_tracker.pop_lost(5.9) == []
+    assert "AAAA" in liveness_tracker
+
+
+def test_liveness_tracker_lost(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+    liveness_tracker.seen("BBBB", 3)
+
+    assert liveness_tracker.pop_lost(6) == ["AAAA"]
+    assert "AAAA" not in liveness_tracker
+    assert liveness_tracker.next_deadline() == 8
+
+
+def test_liveness_tracker_seen_again_rescheduled(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+    liveness_tracker.seen("AAAA", 4)
+
+    # Seen again after the first deadline was set, so only rescheduled
+    assert liveness_tracker.pop_lost(6) == []
+    assert liveness_tracker.next_deadline() == 9
+    assert liveness_tracker.pop_lost(9) == ["AAAA"]
+
+
+def test_liveness_tracker_forget(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+    liveness_tracker.forget("AAAA")
+
+    assert "AAAA" not in liveness_tracker
+    assert liveness_tracker.next_deadline() is None
+    assert liveness_tracker.pop_lost(100) == []
+
+
+def test_liveness_tracker_forget_unknown(liveness_tracker):
+    liveness_tracker.forget("AAAA")
+
+    assert len(liveness_tracker) == 0
+
+
+def test_liveness_tracker_seen_after_forget(liveness_tracker):
+    liveness_tracker.seen("AAAA", 1)
+    liveness_tracker.forget("AAAA")
+    liveness_tracker.seen("AAAA", 10)
+
+    assert liveness_tracker.pop_lost(6) == []
+    assert liveness_tracker.pop_lost(15) == ["AAAA"]
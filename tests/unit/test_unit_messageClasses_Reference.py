@@ -103,6 +103,31 @@ def test_decode_frame_valid_input(stagelinq_reference, owntoken, devicetoken):
     assert stagelinq_reference.Reference == 313
 
 
+def test_decode_frame_start_offset(stagelinq_reference, owntoken, devicetoken):
+    dummy_frame = bytearray(
+        b"AAAA"
+        + PyStageLinQ.DataClasses.StageLinQMessageIDs.StageLinQReferenceData
+        + owntoken.get_token().to_bytes(16, byteorder="big")
+        + devicetoken.get_token().to_bytes(16, byteorder="big")
+        + (313).to_bytes(8, byteorder="big")
+    )
+
+    assert (
+        stagelinq_reference.decode_frame(dummy_frame, 4) == PyStageLinQError.STAGELINQOK
+    )
+
+    assert stagelinq_reference.OwnToken.get_token() == owntoken.get_token()
+    assert stagelinq_reference.DeviceToken.get_token() == devicetoken.get_token()
+    assert stagelinq_reference.Reference == 313
+
+
+def test_decode_frame_start_offset_invalid_length(stagelinq_reference):
+    assert (
+        stagelinq_reference.decode_frame(random.randbytes(44), 1)
+        == PyStageLinQError.INVALIDLENGTH
+    )
+
+
 def test_verify_get_data(stagelinq_reference, owntoken, devicetoken):
     stagelinq_reference.OwnToken = owntoken.get_token().to_bytes(16, byteorder="big")
     stagelinq_reference.DeviceToken = devicetoken.get_token().to_bytes(
@@ -73,6 +73,32 @@ def test_decode_frame_valid_input(stagelinq_request_services, dummy_token):
     )
 
 
+def test_decode_frame_start_offset(stagelinq_request_services, dummy_token):
+    dummy_frame = bytearray(
+        b"AAAA"
+        + PyStageLinQ.DataClasses.StageLinQMessageIDs.StageLinQServiceRequestData
+        + dummy_token.get_token().to_bytes(16, byteorder="big")
+    )
+
+    assert (
+        stagelinq_request_services.decode_frame(dummy_frame, 4)
+        == PyStageLinQError.STAGELINQOK
+    )
+
+    # Token must not be a slice of the receive buffer
+    assert type(stagelinq_request_services.Token) is bytes
+    assert stagelinq_request_services.Token == dummy_token.get_token().to_bytes(
+        16, byteorder="big"
+    )
+
+
+def test_decode_frame_start_offset_invalid_length(stagelinq_request_services):
+    assert (
+        stagelinq_request_services.decode_frame(random.randbytes(20), 1)
+        == PyStageLinQError.INVALIDLENGTH
+    )
+
+
 def test_verify_get_data(stagelinq_request_services, dummy_token):
     stagelinq_request_services.Token = dummy_token.get_token().to_bytes(
         16, byteorder="big"
@@ -166,6 +166,31 @@ def test_decode_frame_valid_input(
     assert stagelinq_service_announcement.get_len() == 32
 
 
+def test_decode_frame_start_offset(
+    stagelinq_service_announcement, dummy_token, dummy_port
+):
+    test_string = "hello"
+    dummy_frame = bytearray(
+        b"AAAA"
+        + PyStageLinQ.DataClasses.StageLinQMessageIDs.StageLinQServiceAnnouncementData
+        + dummy_token.get_token().to_bytes(16, byteorder="big")
+        + (2 * len(test_string)).to_bytes(4, byteorder="big")
+        + test_string.encode(encoding="UTF-16be")
+        + dummy_port.to_bytes(2, byteorder="big")
+    )
+
+    assert (
+        stagelinq_service_announcement.decode_frame(dummy_frame, 4)
+        == PyStageLinQError.STAGELINQOK
+    )
+
+    assert stagelinq_service_announcement.Token.get_token() == dummy_token.get_token()
+    assert stagelinq_service_announcement.Service == test_string
+    assert stagelinq_service_announcement.Port == dummy_port
+    # Length of the frame itself, not including the data before it
+    assert stagelinq_service_announcement.get_len() == len(dummy_frame) - 4
+
+
 def test_decode_port_to_short(
     stagelinq_service_announcement, dummy_token, dummy_port, monkeypatch
 ):